@@ -1,11 +1,42 @@
+from operator import attrgetter
+from pathlib import Path
+
+import numpy as np
 import streamlit as st
 import pandas as pd
 
-from src.option_pricer.utils.data.data_loader import LoaderConfig, MarketDataLoader
+from src.option_pricer.utils.data.data_loader import LoaderConfig, load_option_chain
 from src.option_pricer.utils.data_processors.option_chain_processor import OptionChainProcessor
 from src.option_pricer.utils.data_processors.iv_surface_builder import IVSurfaceBuilder
 from src.option_pricer.utils.data_processors.iv_surface_plot import plot_iv_surface
 
+# Chains come from `load_option_chain` (st.cache_data, 10 min) over the loader's on-disk
+# response cache, kept next to this file (not the CWD) so new sessions skip the download too
+_LOADER_CONFIG = LoaderConfig(cache_dir=str(Path(__file__).resolve().parent / ".cache" / "yfinance"))
+
+
+# Results-table column -> OptionPoint attribute
+_POINT_COLUMNS = {
+	"symbol": "symbol",
+	"expiry": "expiry",
+	"strike": "strike",
+	"type": "type",
+	"bid": "bid",
+	"ask": "ask",
+	"mid": "mid",
+	"iv": "implied_vol",
+	"delta": "delta",
+	"gamma": "gamma",
+	"theta": "theta",
+	"rho": "rho",
+}
+
+
+def _drop_nan_edges(df: pd.DataFrame) -> pd.DataFrame:
+	"""Drop all-NaN rows and columns in one slice (masks from a single NaN scan)."""
+	nan = np.isnan(df.to_numpy(dtype=float))
+	return df.loc[df.index[~nan.all(axis=1)], df.columns[~nan.all(axis=0)]]
+
 
 def main() -> None:
 	"""Single-page Streamlit app for IV surface exploration."""
@@ -52,65 +83,37 @@ def main() -> None:
 		return
 
 	with st.spinner("Loading option chain and building IV surface..."):
-		# 1) Load option chain
-		loader_cfg = LoaderConfig(
-			min_open_interest=int(min_open_interest),
+		# 1) Load the unfiltered option chain (cached), then apply liquidity filters on the column masks
+		chain = load_option_chain(ticker, filter=False, config=_LOADER_CONFIG).filter_liquid(
+			min_oi=int(min_open_interest),
 			min_volume=int(min_volume),
 			max_spread_pct=float(max_spread_pct),
+			ignore_stale_last=False,
 		)
-		loader = MarketDataLoader(loader_cfg)
-		chain = loader.get_option_chain(ticker=ticker, filter=True, tag_liquidity=False)
+		# As the loader's liquidity check: a contract without a usable mid is not liquid
+		chain = chain.select(~np.isnan(chain.mids))
 
-		if not chain.contracts:
+		if len(chain) == 0:
 			st.warning("No liquid option contracts returned for this configuration.")
 			return
 
 		# 2) Process contracts into OptionPoint objects with IVs
 		processor = OptionChainProcessor(risk_free_rate=risk_free_rate, dividend_yield=dividend_yield)
 
-		raw_chain: list[dict] = []
 		spot = chain.spot or 0.0
-		for c in chain.contracts:
-			# Use per-contract maturity (in years) as tau
-			tau = c.maturity_years or 0.0
-			if tau <= 0:
-				continue
-
-			# Respect option type filter
-			if option_type_filter == "Calls" and c.option_type != "C":
-				continue
-			if option_type_filter == "Puts" and c.option_type != "P":
-				continue
-
-			raw_chain.append(
-				{
-					"symbol": c.symbol,
-					"expiry": c.expiry,
-					"strike": c.strike,
-					"type": c.option_type,
-					"bid": c.bid or 0.0,
-					"ask": c.ask or 0.0,
-				}
-			)
-
-		if not raw_chain:
+		# Respect option type filter (column mask, no per-contract loop)
+		if option_type_filter == "Calls":
+			chain = chain.select(chain.types == 0)
+		elif option_type_filter == "Puts":
+			chain = chain.select(chain.types == 1)
+
+		if not (np.nan_to_num(chain.maturity_years) > 0).any():
 			st.warning("No contracts passed the filters/maturity check to compute IV.")
 			return
 
-		# OptionChainProcessor expects a single tau, but our options have varying maturities.
-		# We call it per-expiry to keep tau consistent within each batch.
-		points = []
-		df_raw = pd.DataFrame(raw_chain)
-		for expiry, df_group in df_raw.groupby("expiry"):
-			sample_contracts = [c for c in chain.contracts if c.expiry == expiry]
-			if not sample_contracts:
-				continue
-			tau = sample_contracts[0].maturity_years or 0.0
-			if tau <= 0:
-				continue
-
-			group_list = df_group.to_dict(orient="records")
-			points.extend(processor.process_chain(group_list, spot=spot, tau=tau))
+		# Solved straight from the chain's column arrays, per-contract maturity (in years) as tau;
+		# the IVs are written back into chain.implied_vols for the surface builder
+		points = processor.process_option_chain(chain)
 
 		if not points:
 			st.warning("Implied volatilities could not be computed for any contracts.")
@@ -118,54 +121,24 @@ def main() -> None:
 
 		# 3) Display full OptionChainProcessor results
 		st.subheader("Processed Option Chain (OptionChainProcessor output)")
-		points_df = pd.DataFrame(
-			[
-				{
-					"symbol": p.symbol,
-					"expiry": p.expiry,
-					"strike": p.strike,
-					"type": p.type,
-					"bid": p.bid,
-					"ask": p.ask,
-					"mid": p.mid,
-					"iv": p.implied_vol,
-					"delta": p.delta,
-					"gamma": p.gamma,
-					"theta": p.theta,
-					"rho": p.rho,
-				}
-				for p in points
-			]
-		)
+		# One attrgetter pass, transposed into columns (no per-row dicts)
+		columns = zip(*map(attrgetter(*_POINT_COLUMNS.values()), points))
+		points_df = pd.DataFrame(dict(zip(_POINT_COLUMNS, map(list, columns))))
 		st.dataframe(points_df)
 
-		# 4) Build IV surfaces for calls and puts from OptionPoint list
-		# Map OptionPoint -> minimal OptionContract-like objects, including maturity_years in years
-		contracts_like = []
-		for p in points:
-			# find matching original contract to grab maturity_years in years
-			orig = next((c for c in chain.contracts if c.expiry == p.expiry and c.strike == p.strike and c.option_type == p.type), None)
-			maturity_years = orig.maturity_years if orig is not None else None
-
-			contracts_like.append(
-				type("_TmpContract", (), {
-					"expiry": p.expiry,
-					"maturity_years": maturity_years,
-					"strike": p.strike,
-					"implied_vol": p.implied_vol,
-					"option_type": p.type,
-			})()
-			)
-
-		builder = IVSurfaceBuilder()
-		df_flat = builder.to_dataframe(contracts_like)
+		# 4) Build IV surfaces for calls and puts from the chain columns (maturity_years in years)
+		df_flat = IVSurfaceBuilder.chain_to_dataframe(chain)
+		# float32 is plenty for a plotted surface and halves what Streamlit has to ship
+		df_flat["iv"] = df_flat["iv"].astype(np.float32)
 		call_surface, put_surface = IVSurfaceBuilder.build_iv_surfaces(df_flat)
+		call_surface = call_surface.astype(np.float32)
+		put_surface = put_surface.astype(np.float32)
 
 		# Drop columns/rows that are entirely NaN
 		if not call_surface.empty:
-			call_surface = call_surface.dropna(axis=0, how="all").dropna(axis=1, how="all")
+			call_surface = _drop_nan_edges(call_surface)
 		if not put_surface.empty:
-			put_surface = put_surface.dropna(axis=0, how="all").dropna(axis=1, how="all")
+			put_surface = _drop_nan_edges(put_surface)
 
 		if call_surface.empty and put_surface.empty:
 			st.warning("IV call/put surfaces are empty after filtering NaNs.")
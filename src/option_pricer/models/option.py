@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionContract:
     """
     Represents one option contract (one strike, one expiry, one type).
@@ -28,6 +29,7 @@ class OptionContract:
     vega: Optional[float] = None            # Sensitivity of option price to changes in implied volatility
     moneyness: Optional[float] = None       # Strike / Spot (use ln(K/S) for some models)
     maturity_years: Optional[float] = None  # Time to expiry in years
+    is_liquid: Optional[bool] = None        # Set by MarketDataLoader liquidity tagging (None = not tagged)
 
     # -------------------------------------------------
     def compute_mid(self) -> float:
@@ -78,35 +80,238 @@ class OptionContract:
         """
         return self.mid if self.mid is not None else self.last
 
-@dataclass
+
+# Column encoding for option type (OptionChain.types)
+_TYPE_CODES: Dict[str, int] = {"C": 0, "P": 1}
+_TYPE_LABELS = np.array(["C", "P"])
+
+
+def _f8(values) -> np.ndarray:
+    """Float column; None becomes NaN."""
+    return np.array(values, dtype=np.float64).reshape(-1)
+
+
+def _opt_float(v: float) -> Optional[float]:
+    return None if v != v else v
+
+
+def _opt_int(v: float) -> Optional[int]:
+    return None if v != v else int(v)
+
+
+# OptionChain's memo slots; assigning them must not reset the memo itself
+_VIEW_CACHE_FIELDS = frozenset(("_by_expiry_cache", "_expiries_cache"))
+
+
+@dataclass(slots=True, eq=False)
 class OptionChain:
     """
     Represents a full option chain (all expiries, all strikes).
+
+    Contracts are stored column-wise (struct-of-arrays): one NumPy array per field,
+    aligned by position. Missing numeric values are NaN; `types` is 0 = call, 1 = put.
+    Use `from_contracts` to build from OptionContract records and the `contracts`
+    property to get records back.
     """
     underlying: str         # underlying asset ticker (e.g. "AAPL")
     as_of: str              # date for which the chain snapshot is taken (e.g. "YYYY-MM-DD")
     spot: Optional[float] = None    # spot price of the underlying asset when the snapshot was taken
-    contracts: List[OptionContract] = field(default_factory=list) # List of all OptionContracts in the chain
+
+    # Per-contract columns (see OptionContract for field meanings)
+    symbols: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    expiry_dates: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    strikes: np.ndarray = field(default_factory=lambda: np.empty(0))
+    types: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+    bids: np.ndarray = field(default_factory=lambda: np.empty(0))
+    asks: np.ndarray = field(default_factory=lambda: np.empty(0))
+    lasts: np.ndarray = field(default_factory=lambda: np.empty(0))
+    volumes: np.ndarray = field(default_factory=lambda: np.empty(0))
+    ois: np.ndarray = field(default_factory=lambda: np.empty(0))
+    mids: np.ndarray = field(default_factory=lambda: np.empty(0))
+    implied_vols: np.ndarray = field(default_factory=lambda: np.empty(0))
+    vegas: np.ndarray = field(default_factory=lambda: np.empty(0))
+    moneyness: np.ndarray = field(default_factory=lambda: np.empty(0))
+    maturity_years: np.ndarray = field(default_factory=lambda: np.empty(0))
+    is_liquid: Optional[np.ndarray] = None   # bool column, set by liquidity tagging
+
+    # Memoized views (slots rule out cached_property); reset whenever a field is
+    # reassigned (see __setattr__) or by invalidate_views() after in-place writes
+    _by_expiry_cache: Optional[Dict[str, List[OptionContract]]] = field(default=None, init=False, repr=False)
+    _expiries_cache: Optional[List[str]] = field(default=None, init=False, repr=False)
+
+    # -------------------------------------------------
+    @classmethod
+    def from_contracts(
+        cls,
+        underlying: str,
+        as_of: str,
+        spot: Optional[float] = None,
+        contracts: Optional[List[OptionContract]] = None,
+    ) -> "OptionChain":
+        """
+        Builds the column layout from a list of OptionContract records.
+        """
+        contracts = contracts or []
+        tagged = any(c.is_liquid is not None for c in contracts)
+        return cls(
+            underlying=underlying,
+            as_of=as_of,
+            spot=spot,
+            symbols=np.array([c.symbol for c in contracts], dtype=object),
+            expiry_dates=np.array([c.expiry for c in contracts], dtype=object),
+            strikes=_f8([c.strike for c in contracts]),
+            types=np.array([_TYPE_CODES[c.option_type] for c in contracts], dtype=np.uint8),
+            bids=_f8([c.bid for c in contracts]),
+            asks=_f8([c.ask for c in contracts]),
+            lasts=_f8([c.last for c in contracts]),
+            volumes=_f8([c.volume for c in contracts]),
+            ois=_f8([c.open_interest for c in contracts]),
+            mids=_f8([c.mid for c in contracts]),
+            implied_vols=_f8([c.implied_vol for c in contracts]),
+            vegas=_f8([c.vega for c in contracts]),
+            moneyness=_f8([c.moneyness for c in contracts]),
+            maturity_years=_f8([c.maturity_years for c in contracts]),
+            is_liquid=np.array([bool(c.is_liquid) for c in contracts], dtype=bool) if tagged else None,
+        )
+
+    # -------------------------------------------------
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        # Any reassigned column (chain.mids = ..., IV write-back, tagging) may change the views
+        if name not in _VIEW_CACHE_FIELDS:
+            object.__setattr__(self, "_by_expiry_cache", None)
+            object.__setattr__(self, "_expiries_cache", None)
+
+    # -------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    # -------------------------------------------------
+    @property
+    def contracts(self) -> List[OptionContract]:
+        """
+        Row view for legacy callers: one OptionContract per position.
+        Records are materialized on each access; edits are not written back.
+        """
+        is_liquid = self.is_liquid.tolist() if self.is_liquid is not None else [None] * len(self)
+        return [
+            OptionContract(
+                symbol=sym,
+                underlying=self.underlying,
+                expiry=exp,
+                strike=k,
+                option_type=t,
+                bid=_opt_float(b),
+                ask=_opt_float(a),
+                last=_opt_float(l),
+                volume=_opt_int(v),
+                open_interest=_opt_int(oi),
+                mid=_opt_float(m),
+                implied_vol=_opt_float(iv),
+                vega=_opt_float(vg),
+                moneyness=_opt_float(mn),
+                maturity_years=_opt_float(mat),
+                is_liquid=liq,
+            )
+            for sym, exp, k, t, b, a, l, v, oi, m, iv, vg, mn, mat, liq in zip(
+                self.symbols.tolist(),
+                self.expiry_dates.tolist(),
+                self.strikes.tolist(),
+                _TYPE_LABELS[self.types].tolist(),
+                self.bids.tolist(),
+                self.asks.tolist(),
+                self.lasts.tolist(),
+                self.volumes.tolist(),
+                self.ois.tolist(),
+                self.mids.tolist(),
+                self.implied_vols.tolist(),
+                self.vegas.tolist(),
+                self.moneyness.tolist(),
+                self.maturity_years.tolist(),
+                is_liquid,
+            )
+        ]
+
+    # -------------------------------------------------
+    def select(self, mask: np.ndarray) -> "OptionChain":
+        """
+        Returns a new OptionChain with every column indexed by `mask`
+        (boolean mask or integer positions).
+        """
+        return OptionChain(
+            underlying=self.underlying,
+            as_of=self.as_of,
+            spot=self.spot,
+            symbols=self.symbols[mask],
+            expiry_dates=self.expiry_dates[mask],
+            strikes=self.strikes[mask],
+            types=self.types[mask],
+            bids=self.bids[mask],
+            asks=self.asks[mask],
+            lasts=self.lasts[mask],
+            volumes=self.volumes[mask],
+            ois=self.ois[mask],
+            mids=self.mids[mask],
+            implied_vols=self.implied_vols[mask],
+            vegas=self.vegas[mask],
+            moneyness=self.moneyness[mask],
+            maturity_years=self.maturity_years[mask],
+            is_liquid=self.is_liquid[mask] if self.is_liquid is not None else None,
+        )
 
     # -------------------------------------------------
     def enrich(self):
         """
-        Computes all derived fields for all contracts.
+        Computes all derived fields for all contracts (column-wise).
+        """
+        # mid: bid/ask average, falling back to last trade
+        has_quote = ~np.isnan(self.bids) & ~np.isnan(self.asks)
+        self.mids = np.where(has_quote, 0.5 * (self.bids + self.asks), self.lasts)
+
+        # moneyness: K / S
+        if self.spot is not None and self.spot > 0:
+            self.moneyness = self.strikes / self.spot
+
+        # maturity in years, parsed once per unique expiry
+        try:
+            today = datetime.strptime(self.as_of, "%Y-%m-%d").date()
+        except Exception:
+            self.maturity_years = np.full(len(self), np.nan)
+            return
+        unique, inverse = np.unique(self.expiry_dates.astype(str), return_inverse=True)
+        years = np.empty(len(unique))
+        for i, expiry in enumerate(unique):
+            try:
+                expiry_dt = datetime.strptime(expiry, "%Y-%m-%d").date()
+                years[i] = max((expiry_dt - today).days, 0) / 365.0
+            except Exception:
+                years[i] = np.nan
+        self.maturity_years = years[inverse.reshape(-1)]
+
+    # -------------------------------------------------
+    def invalidate_views(self) -> None:
+        """
+        Drops the memoized `by_expiry` / `expiries` views. Reassigning a field does this
+        automatically; call it only after writing into a column in place
+        (e.g. `chain.mids[i] = ...`).
         """
-        for c in self.contracts:
-            c.compute_mid()
-            c.compute_moneyness(self.spot)
-            c.compute_maturity(self.as_of)
+        self._by_expiry_cache = None
+        self._expiries_cache = None
 
     # -------------------------------------------------
     def by_expiry(self) -> Dict[str, List[OptionContract]]:
         """
         Groups contracts sorted by expiry date.
+        Built on first call and reused afterwards: filters return new chains, reassigning
+        a field resets it, and in-place element writes call `invalidate_views`, so the
+        grouping stays valid.
         """
-        out: Dict[str, List[OptionContract]] = {}
-        for c in self.contracts:
-            out.setdefault(c.expiry, []).append(c)
-        return out
+        if self._by_expiry_cache is None:
+            out: Dict[str, List[OptionContract]] = {}
+            for c in self.contracts:
+                out.setdefault(c.expiry, []).append(c)
+            self._by_expiry_cache = out
+        return self._by_expiry_cache
 
     # -------------------------------------------------
     def filter_liquid(
@@ -120,72 +325,54 @@ class OptionChain:
         Returns a new OptionChain containing only contracts
         with realistic liquidity and price quality.
         """
+        oi = np.nan_to_num(self.ois, nan=0.0)
+        vol = np.nan_to_num(self.volumes, nan=0.0)
+        has_quote = ~np.isnan(self.bids) & ~np.isnan(self.asks)
 
-        filtered = []
-
-        for c in self.contracts:
-            oi = c.open_interest or 0
-            vol = c.volume or 0
-
-            # 1) Minimum open interest
-            if oi < min_oi:
-                continue
-
-            # 2) Minimum daily volume
-            if vol < min_volume:
-                continue
+        # 1) Minimum open interest, 2) minimum daily volume
+        mask = (oi >= min_oi) & (vol >= min_volume)
 
-            # 3) Maximum bid–ask spread % (only if we have both)
-            if c.bid is not None and c.ask is not None and c.bid > 0:
-                spread_pct = (c.ask - c.bid) / c.bid
-                if spread_pct > max_spread_pct:
-                    continue
+        # 3) Maximum bid–ask spread % (only if we have both)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread_pct = (self.asks - self.bids) / self.bids
+        mask &= ~(has_quote & (self.bids > 0) & (spread_pct > max_spread_pct))
 
-            # 4) Ignore stale last prices (if bid/ask is missing)
-            if ignore_stale_last:
-                if c.bid is None or c.ask is None:
-                    # last price may be hours old → discard
-                    continue
+        # 4) Ignore stale last prices (if bid/ask is missing)
+        if ignore_stale_last:
+            # last price may be hours old → discard
+            mask &= has_quote
 
-            filtered.append(c)
-
-        return OptionChain(
-            underlying=self.underlying,
-            as_of=self.as_of,
-            spot=self.spot,
-            contracts=filtered,
-        )
+        return self.select(mask)
 
 
     # -------------------------------------------------
     def to_dataframe(self) -> pd.DataFrame:
         """
-        Converts all contracts into a Pandas DataFrame.
-        """
-        rows = []
-        for c in self.contracts:
-            rows.append({
-                "symbol": c.symbol,
-                "underlying": c.underlying,
-                "expiry": c.expiry,
-                "strike": c.strike,
-                "type": c.option_type,
-                "bid": c.bid,
-                "ask": c.ask,
-                "mid": c.mid,
-                "last": c.last,
-                "volume": c.volume,
-                "open_interest": c.open_interest,
-                "iv": c.implied_vol,
-                "vega": c.vega,
-                "moneyness": c.moneyness,
-                "maturity": c.maturity_years,
-            })
-        return pd.DataFrame(rows)
+        Converts all contracts into a Pandas DataFrame (column-wise, no per-row dicts).
+        """
+        return pd.DataFrame({
+            "symbol": self.symbols,
+            "underlying": self.underlying,
+            "expiry": self.expiry_dates,
+            "strike": self.strikes,
+            "type": _TYPE_LABELS[self.types],
+            "bid": self.bids,
+            "ask": self.asks,
+            "mid": self.mids,
+            "last": self.lasts,
+            "volume": self.volumes,
+            "open_interest": self.ois,
+            "iv": self.implied_vols,
+            "vega": self.vegas,
+            "moneyness": self.moneyness,
+            "maturity": self.maturity_years,
+        })
 
     # -------------------------------------------------
     def expiries(self) -> List[str]:
         """
-        Returns all unique expiry dates.
+        Returns all unique expiry dates (computed once, see `by_expiry`).
         """
-        return sorted({c.expiry for c in self.contracts})
+        if self._expiries_cache is None:
+            self._expiries_cache = sorted(set(self.expiry_dates.tolist()))
+        return self._expiries_cache
@@ -0,0 +1,66 @@
+# utils/data/cache.py
+"""
+Small on-disk cache for network responses.
+
+Entries are pickled one per file under `cache_dir/<namespace>/`, named by the
+md5 of their key, and expire by file mtime after `ttl_s` seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """
+    Pickle-per-key file cache with mtime-based TTL.
+    Usage:
+        cache = FileCache(".cache/yfinance", ttl_s=600)
+        value = cache.get("AAPL", "AAPL", "2025-01-17", "2025-01-02")
+        if value is None:
+            value = fetch()
+            cache.set("AAPL", value, "AAPL", "2025-01-17", "2025-01-02")
+    """
+
+    def __init__(self, cache_dir: str, ttl_s: float = 600.0):
+        self.cache_dir = cache_dir
+        self.ttl_s = ttl_s
+
+    def _path(self, namespace: str, *key_parts: str) -> str:
+        # Unit separator between parts: ("AB", "C") and ("A", "BC") must not share a file
+        digest = hashlib.md5("\x1f".join(map(str, key_parts)).encode()).hexdigest()
+        return os.path.join(self.cache_dir, namespace, f"{digest}.pkl")
+
+    def get(self, namespace: str, *key_parts: str) -> Optional[Any]:
+        """Cached value for the key, or None if missing, expired or unreadable."""
+        path = self._path(namespace, *key_parts)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_s:
+                return None
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+    def set(self, namespace: str, value: Any, *key_parts: str) -> None:
+        """Store `value` under the key (atomic replace; failures are logged, not raised)."""
+        path = self._path(namespace, *key_parts)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.debug("Could not write cache entry %s: %s", path, e)
@@ -3,32 +3,70 @@
 MarketDataLoader for option chains.
 
 Features:
-- Threaded expiry downloads (configurable max_workers)
-- Retry + exponential backoff for flaky network calls
+- Threaded expiry downloads (configurable max_workers), or asyncio coroutines behind `use_async`
+- Awaitable `get_option_chain_async` for callers running their own event loop (e.g. many tickers)
+- Streaming per-expiry API (`get_option_chain_streaming`) for consumers that process shards as they land
+- One shared HTTP session (connection pool) for every yfinance request
+- Retry + jittered exponential backoff for flaky network calls (429/5xx only, honours Retry-After)
+- Process-wide semaphore cap on concurrent yfinance requests (shared by every loader)
+- Opt-in on-disk TTL cache of yfinance responses (per ticker/expiry/day), see `FileCache`
 - Optional non-destructive liquidity tagging (is_liquid flag)
 - Configurable liquidity filters (min OI, min volume, max spread pct, stale-last policy)
 - Attaches spot to OptionChain and computes derived fields
 - Clear extension point for computing implied vol / vega (placeholder)
-- Streamlit cache decorator (commented) ready
+- `load_option_chain`: module-level entry memoized with st.cache_data when Streamlit is installed
 """
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
+import random
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple, Callable
+from itertools import chain as chain_iter
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Tuple, Callable, Iterator
 
+import numpy as np
+import pandas as pd
+import requests
 import yfinance as yf
+from requests.adapters import HTTPAdapter
 
 from src.option_pricer.models.option import OptionContract, OptionChain
+from src.option_pricer.utils.data.cache import FileCache
+
+try:  # yfinance >= 0.2.55 raises a dedicated error on Yahoo 429s
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:
+    YFRateLimitError = None
+
+try:  # optional: browser-impersonating session (what yfinance itself prefers; fewer 429s)
+    from curl_cffi import requests as curl_requests
+except ImportError:
+    curl_requests = None
+
+try:  # optional: memoize load_option_chain across Streamlit reruns
+    import streamlit as st
+except ImportError:
+    st = None
+
+try:  # optional: progress bar for the async fan-out
+    from tqdm.asyncio import tqdm_asyncio
+except ImportError:
+    tqdm_asyncio = None
 
 """Set up logging."""
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+_STRIKE_TYPE_KEY = attrgetter("strike", "option_type")
+
 
 @dataclass
 class LoaderConfig:
@@ -39,8 +77,60 @@ class LoaderConfig:
     ignore_stale_last: bool = False     # if True, require bid & ask to compute mid; otherwise allow last
     
     max_workers: int = 8
+    max_concurrent_requests: int = 4   # in-flight yfinance calls per process, across all loaders (< max_workers)
     retries: int = 3
     backoff_factor: float = 0.8        # exponential backoff multiplier (seconds)
+    max_wait_s: float = 30.0           # cap on a single backoff wait (including Retry-After)
+    retry_on_status: Tuple[int, ...] = (429, 500, 502, 503, 504)   # other HTTP errors are not retried
+
+    use_async: bool = False            # if True, fetch expiries as coroutines (on one event loop) instead of a thread pool
+
+    # Opt-in on-disk response cache (pickles under this directory; None = off). Give an absolute
+    # path: a relative one lands wherever the process was started
+    cache_dir: Optional[str] = None
+    cache_ttl_s: float = 600.0         # cache entry lifetime (seconds)
+
+def _streamlit_cache(func: Callable) -> Callable:
+    """st.cache_data(ttl=600) when Streamlit is installed; the function unchanged otherwise."""
+    if st is None:
+        return func
+    return st.cache_data(ttl=600, show_spinner=False)(func)
+
+
+# One semaphore per limit, shared by every MarketDataLoader in the process: app.py builds a
+# new loader per load, so a per-instance semaphore would never see the other loaders' calls
+_REQUEST_SEMAPHORES: Dict[int, threading.BoundedSemaphore] = {}
+_REQUEST_SEMAPHORES_LOCK = threading.Lock()
+
+
+def _request_semaphore(limit: int) -> threading.BoundedSemaphore:
+    """The process-wide semaphore capping in-flight yfinance calls at `limit`."""
+    limit = max(1, int(limit))
+    with _REQUEST_SEMAPHORES_LOCK:
+        sem = _REQUEST_SEMAPHORES.get(limit)
+        if sem is None:
+            sem = _REQUEST_SEMAPHORES[limit] = threading.BoundedSemaphore(limit)
+        return sem
+
+
+def _http_status(exc: BaseException) -> Optional[int]:
+    """HTTP status behind a yfinance / requests / curl_cffi error, if any."""
+    if YFRateLimitError is not None and isinstance(exc, YFRateLimitError):
+        return 429
+    status = getattr(exc, "status", None)                          # errors carrying a bare status
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after_s(exc: BaseException) -> Optional[float]:
+    """Retry-After header (seconds form) from the failed response, if the server sent one."""
+    headers = getattr(exc, "headers", None) or getattr(getattr(exc, "response", None), "headers", None)
+    try:
+        return float(headers.get("Retry-After")) if headers else None
+    except (TypeError, ValueError):
+        return None
+
 
 class MarketDataLoader:
     """
@@ -53,94 +143,243 @@ class MarketDataLoader:
 
     def __init__(self, config: Optional[LoaderConfig] = None):
         self.config = config or LoaderConfig()
+        self.cache = FileCache(self.config.cache_dir, self.config.cache_ttl_s) if self.config.cache_dir else None
+        self._session = self._make_session(self.config.max_workers)
+        self._rate_sem = _request_semaphore(self.config.max_concurrent_requests)   # shared across loaders
 
-    # To cache results if function is ran using the same input:
-    # @st.cache_data(ttl=60*10)
+    # Streamlit flows (app.py) go through the module-level `load_option_chain` (st.cache_data, 10 min TTL)
     def get_option_chain(self, ticker: str, filter: bool = True, tag_liquidity: bool = False) -> OptionChain:
         """
         Download the option chain for `ticker` and return an OptionChain.
 
         :param ticker: ticker symbol, e.g. "AAPL"
         :param filter: if True, apply liquidity filters (destructive: removes illiquid contracts)
-        :param tag_liquidity: if True, keep all contracts but set attribute `is_liquid` on contracts
+        :param tag_liquidity: if True, keep all contracts but set field `is_liquid` on contracts
                                NOTE: if both filter=True and tag_liquidity=True, filtering is applied
                                and tagging is performed on the filtered results.
         """
-        tk = yf.Ticker(ticker)                                 # yfinance Ticker object
-        as_of_date = datetime.utcnow().date().isoformat()      # record current snapshot date
+        if self.config.use_async:
+            # One event loop, all expiries in flight at once
+            return asyncio.run(self.get_option_chain_async(ticker, filter=filter, tag_liquidity=tag_liquidity))
 
-        expiries: List[str] = list(getattr(tk, "options", []) or [])        # list of expiry dates
-        logger.info("Ticker %s: found %d expiries", ticker, len(expiries))  # log expiry count
-
-        spot = self._safe_get_spot_with_retry(tk)                     # attempt to get spot price with retries
-        if spot is None:
-            logger.warning("Ticker %s: could not retrieve spot price; moneyness will be None", ticker)
+        tk, expiries, spot = self._open_ticker(ticker)
+        as_of_date = datetime.utcnow().date().isoformat()      # record current snapshot date
+        by_expiry = self._load_expiries_threaded(tk, ticker, expiries, spot)
+        return self._assemble_chain(ticker, as_of_date, spot, by_expiry, filter, tag_liquidity)
 
-        contracts: List[OptionContract] = []
-        if expiries:
-            # Use multithreading to load each expiry in parallel
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as ex:
-                future_to_expiry = {}   # Creates a dictionary with type: Dict[Any, str]  
-                # Loop through all expiry load tasks
-                for expiry in expiries:
-                    future = ex.submit(self._load_single_expiry_with_retry, tk, expiry, spot) # Fetch call and put prices concurrently
-                    future_to_expiry[future] = expiry                                         # Map future to expiry date
-
-                # Wait for all futures to complete using as_completed
-                for fut in as_completed(future_to_expiry):
-                    expiry = future_to_expiry[fut]          # Get the expiry date for this future
-                    try:
-                        loaded = fut.result()               # Get the call and put result from yfinance
-                        contracts.extend(loaded)            # Insert loaded contract list into a bigger list (2D list)
-                        logger.info("Ticker %s: loaded %d contracts for expiry %s", ticker, len(loaded), expiry)
-                    except Exception as e:
-                        logger.exception("Ticker %s: failed loading expiry %s: %s", ticker, expiry, e)
-
-        # Sort contracts for deterministic ordering
-        contracts = sorted(contracts, key=lambda c: (c.expiry, c.strike, c.option_type))
-
-        chain = OptionChain(underlying=ticker, as_of=as_of_date, spot=spot, contracts=contracts)
+    async def get_option_chain_async(self, ticker: str, filter: bool = True, tag_liquidity: bool = False) -> OptionChain:
+        """
+        Awaitable `get_option_chain` (same arguments and result), for callers that already
+        run an event loop, e.g. `await asyncio.gather(*(loader.get_option_chain_async(t) for t in tickers))`.
+        Each expiry is a coroutine awaiting the same yfinance call as the threaded path,
+        run in a worker thread, so the loop is never blocked. The blocking yfinance
+        expiry/spot lookups run in a worker thread too.
+        """
+        tk, expiries, spot = await asyncio.to_thread(self._open_ticker, ticker)
+        as_of_date = datetime.utcnow().date().isoformat()      # record current snapshot date
+        by_expiry = await self._load_expiries_async(tk, ticker, expiries, spot)
+        return self._assemble_chain(ticker, as_of_date, spot, by_expiry, filter, tag_liquidity)
+
+    def _assemble_chain(
+        self,
+        ticker: str,
+        as_of_date: str,
+        spot: Optional[float],
+        by_expiry: Dict[str, List[OptionContract]],
+        filter: bool,
+        tag_liquidity: bool,
+    ) -> OptionChain:
+        """Per-expiry contract lists -> enriched (and optionally tagged / filtered) OptionChain."""
+        # Deterministic (expiry, strike, type) order: each expiry's list is already
+        # sorted by (strike, type), so concatenating in expiry order needs no global sort
+        contracts = list(chain_iter.from_iterable(by_expiry[e] for e in sorted(by_expiry)))
+
+        chain = OptionChain.from_contracts(underlying=ticker, as_of=as_of_date, spot=spot, contracts=contracts)
 
         # Calculate derived fields (mid, moneyness, maturity)
         chain.enrich()
 
+        # One liquidity mask shared by tagging and filtering
+        mask = self._liquidity_mask(chain) if (tag_liquidity or filter) else None
+
         # Tag liquidity (non-destructive) if requested
         if tag_liquidity:
-            self._tag_liquidity(chain)
+            self._tag_liquidity(chain, mask)
 
         # Filter (destructive) if requested
         if filter:
-            chain = self._filter_chain(chain)
+            chain = self._filter_chain(chain, mask)
 
-        logger.info("Ticker %s: returning chain with %d contracts", ticker, len(chain.contracts))
+        logger.info("Ticker %s: returning chain with %d contracts", ticker, len(chain))
         return chain
 
+    def get_option_chain_streaming(
+        self,
+        ticker: str,
+        solve_iv: Optional[Callable[[List[OptionContract], Optional[float]], Any]] = None,
+    ) -> Iterator[List[OptionContract]]:
+        """
+        Yield one expiry's contracts at a time, in completion order, as downloads finish.
+
+        Each shard is sorted by (strike, option_type) and already carries mid, moneyness
+        and maturity_years, so callers can start IV work while the remaining expiries are
+        still in flight and never hold the whole chain at once. Unfiltered; no tagging.
+        Always uses the threaded path (use_async is ignored here).
+
+        implied_vol is left None unless `solve_iv(shard, spot)` is given: it is called on
+        each shard before it is yielded and fills implied_vol in place
+        (e.g. OptionChainProcessor.solve_contracts).
+        """
+        tk, expiries, spot = self._open_ticker(ticker)
+        for _, loaded in self._iter_expiries_threaded(tk, ticker, expiries, spot):
+            if solve_iv is not None:
+                solve_iv(loaded, spot)
+            yield loaded
+
+    def _open_ticker(self, ticker: str) -> Tuple[yf.Ticker, List[str], Optional[float]]:
+        """yfinance Ticker on the shared session, its expiry list and spot (None if unavailable)."""
+        tk = yf.Ticker(ticker, session=self._session)          # yfinance Ticker object (shared connection pool)
+
+        expiries: List[str] = list(getattr(tk, "options", []) or [])        # list of expiry dates
+        logger.info("Ticker %s: found %d expiries", ticker, len(expiries))  # log expiry count
+
+        spot = self._safe_get_spot_with_retry(tk)                     # attempt to get spot price with retries
+        if spot is None:
+            logger.warning("Ticker %s: could not retrieve spot price; moneyness will be None", ticker)
+        return tk, expiries, spot
+
+    # ---------------------------
+    # Expiry fan-out
+    # ---------------------------
+    def _load_expiries_threaded(self, tk: yf.Ticker, ticker: str, expiries: List[str], spot: Optional[float]) -> Dict[str, List[OptionContract]]:
+        """Load all expiries through yfinance on a thread pool (default path); returns expiry -> contracts."""
+        return dict(self._iter_expiries_threaded(tk, ticker, expiries, spot))
+
+    def _iter_expiries_threaded(
+        self, tk: yf.Ticker, ticker: str, expiries: List[str], spot: Optional[float]
+    ) -> Iterator[Tuple[str, List[OptionContract]]]:
+        """Yield (expiry, contracts) from the thread pool as each expiry completes; failures are logged and skipped."""
+        if not expiries:
+            return
+        # Use multithreading to load each expiry in parallel
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as ex:
+            future_to_expiry = {}   # Creates a dictionary with type: Dict[Any, str]  
+            # Loop through all expiry load tasks
+            for expiry in expiries:
+                future = ex.submit(self._load_single_expiry_with_retry, tk, expiry, spot) # Fetch call and put prices concurrently
+                future_to_expiry[future] = expiry                                         # Map future to expiry date
+
+            # Wait for all futures to complete using as_completed
+            for fut in as_completed(future_to_expiry):
+                expiry = future_to_expiry[fut]          # Get the expiry date for this future
+                try:
+                    loaded = fut.result()               # Get the call and put result from yfinance
+                except Exception as e:
+                    logger.exception("Ticker %s: failed loading expiry %s: %s", ticker, expiry, e)
+                    continue
+                logger.info("Ticker %s: loaded %d contracts for expiry %s", ticker, len(loaded), expiry)
+                yield expiry, loaded                    # Per-expiry list (sorted by strike, type)
+
+    async def _load_expiries_async(
+        self, tk: yf.Ticker, ticker: str, expiries: List[str], spot: Optional[float]
+    ) -> Dict[str, List[OptionContract]]:
+        """
+        Load all expiries concurrently as coroutines. Each one awaits
+        `_load_single_expiry_with_retry` in a worker thread, i.e. `Ticker.option_chain`
+        on yfinance's own session (its cookie / crumb handling), with the same
+        response cache, retry/backoff and rate-limit semaphore as the threaded path.
+        At most `max_workers` expiries are in flight at once, as with the thread pool.
+        """
+        if not expiries:
+            return {}
+        in_flight = asyncio.Semaphore(max(1, int(self.config.max_workers)))
+
+        async def load(expiry: str) -> List[OptionContract]:
+            async with in_flight:
+                return await asyncio.to_thread(self._load_single_expiry_with_retry, tk, expiry, spot)
+
+        tasks = [load(expiry) for expiry in expiries]
+        gather = tqdm_asyncio.gather if tqdm_asyncio is not None else asyncio.gather
+        results = await gather(*tasks, return_exceptions=True)
+
+        by_expiry: Dict[str, List[OptionContract]] = {}
+        for expiry, loaded in zip(expiries, results):
+            if isinstance(loaded, BaseException):
+                logger.error("Ticker %s: failed loading expiry %s: %s", ticker, expiry, loaded)
+                continue
+            by_expiry[expiry] = loaded
+            logger.info("Ticker %s: loaded %d contracts for expiry %s", ticker, len(loaded), expiry)
+        return by_expiry
+
     # ---------------------------
     # Retry & network helpers
     # ---------------------------
+    @staticmethod
+    def _make_session(pool_size: int):
+        """
+        HTTP session shared by all expiry downloads, so TCP/TLS connections are reused.
+        curl_cffi (Chrome impersonation) when installed, else requests with a pool
+        sized to max_workers; retries are handled by _retry_loop, not the adapter.
+        """
+        if curl_requests is not None:
+            return curl_requests.Session(impersonate="chrome")
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        return session
+
+    def _backoff_wait(self, attempt: int, exc: BaseException) -> Optional[float]:
+        """
+        Seconds to wait before retrying after `exc`, or None if it should not be retried.
+        HTTP errors retry only for `retry_on_status`; Retry-After wins when present;
+        otherwise capped exponential backoff with ±50% jitter so threads don't retry in lockstep.
+        """
+        status = _http_status(exc)
+        if status is not None and status not in self.config.retry_on_status:
+            return None
+        retry_after = _retry_after_s(exc)
+        if retry_after is not None:
+            return min(self.config.max_wait_s, retry_after)
+        backoff = float(self.config.backoff_factor) or 0.5
+        return min(self.config.max_wait_s, backoff * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
     def _retry_loop(self, func: Callable[..., Any], *args, **kwargs) -> Any:
-        """Simple retry loop with exponential backoff."""
+        """
+        Retry loop with jittered exponential backoff; each attempt holds the process-wide
+        request semaphore (backoff sleeps do not), so pool threads beyond
+        `max_concurrent_requests` wait instead of hitting Yahoo.
+        """
         retries = max(0, int(self.config.retries))
-        backoff = float(self.config.backoff_factor) or 0.5
         last_exc = None
         for attempt in range(retries + 1):
             try:
-                return func(*args, **kwargs)
+                with self._rate_sem:
+                    return func(*args, **kwargs)
             except Exception as e:
                 last_exc = e
-                wait = backoff * (2 ** attempt)
+                wait = self._backoff_wait(attempt, e)
+                if wait is None or attempt == retries:
+                    break
                 logger.debug("Attempt %d failed with %s — retrying in %.2fs", attempt + 1, e, wait)
                 time.sleep(wait)
-        # All retries failed
-        logger.exception("All %d retries failed for function %s", retries, getattr(func, "__name__", str(func)))
+        # Out of retries (or not retryable)
+        logger.error("Giving up on %s after %d attempt(s): %s", getattr(func, "__name__", str(func)), attempt + 1, last_exc)
         raise last_exc
 
     def _safe_get_spot_with_retry(self, tk: yf.Ticker) -> Optional[float]:
-        """Wrapper around _safe_get_spot using retry logic."""
+        """Wrapper around _safe_get_spot using retry logic (and the response cache)."""
+        key = (tk.ticker, "spot", self._cache_day())
+        if self.cache is not None:
+            cached = self.cache.get(tk.ticker, *key)
+            if cached is not None:
+                return cached
         try:
-            return self._retry_loop(self._safe_get_spot, tk)
+            spot = self._retry_loop(self._safe_get_spot, tk)
         except Exception:
             return None
+        if self.cache is not None and spot is not None:
+            self.cache.set(tk.ticker, spot, *key)
+        return spot
 
     def _load_single_expiry_with_retry(self, tk: yf.Ticker, expiry: str, spot: Optional[float]) -> List[OptionContract]:
         """Load one expiry with retry logic around yf.option_chain."""
@@ -151,60 +390,112 @@ class MarketDataLoader:
     # ---------------------------
     def _load_single_expiry(self, tk: yf.Ticker, expiry: str, spot: Optional[float]) -> List[OptionContract]:
         """Load one expiry's option chain and convert to OptionContract list."""
-        try:
-            df_chain = tk.option_chain(expiry)
-        except Exception as e:
-            logger.exception("yf.option_chain failed for expiry %s: %s", expiry, e)
-            return []
+        key = (tk.ticker, expiry, self._cache_day())
+        frames = self.cache.get(tk.ticker, *key) if self.cache is not None else None
+        if frames is None:
+            try:
+                df_chain = tk.option_chain(expiry)
+            except Exception as e:
+                if _http_status(e) in self.config.retry_on_status:
+                    raise               # 429/5xx: let _retry_loop back off and try again
+                logger.exception("yf.option_chain failed for expiry %s: %s", expiry, e)
+                return []
+            frames = (df_chain.calls, df_chain.puts)
+            if self.cache is not None:
+                self.cache.set(tk.ticker, frames, *key)
+        calls, puts = frames
 
-        result: List[OptionContract] = []
         # Calls and puts - keep code DRY by delegating to _build_contracts
-        result.extend(self._build_contracts(df_chain.calls, "C", tk.ticker, expiry, spot))
-        result.extend(self._build_contracts(df_chain.puts, "P", tk.ticker, expiry, spot))
-        return result
+        maturity_years = self._maturity_years(expiry)   # once per expiry, shared by both sides
+        return self._merge_sides(
+            self._build_contracts(calls, "C", tk.ticker, expiry, spot, maturity_years),
+            self._build_contracts(puts, "P", tk.ticker, expiry, spot, maturity_years),
+        )
+
+    @staticmethod
+    def _merge_sides(calls: List[OptionContract], puts: List[OptionContract]) -> List[OptionContract]:
+        """One expiry's calls and puts as a single list ordered by (strike, type)."""
+        by_strike = attrgetter("strike")
+        return list(heapq.merge(sorted(calls, key=by_strike), sorted(puts, key=by_strike), key=_STRIKE_TYPE_KEY))
 
-    def _build_contracts(self, df, opt_type: str, underlying: str, expiry: str, spot: Optional[float]) -> List[OptionContract]:
+    @staticmethod
+    def _cache_day() -> str:
+        """Snapshot date used in cache keys (same convention as OptionChain.as_of)."""
+        return datetime.utcnow().date().isoformat()
+
+    def _build_contracts(
+        self,
+        df,
+        opt_type: str,
+        underlying: str,
+        expiry: str,
+        spot: Optional[float],
+        maturity_years: Optional[float] = None,
+    ) -> List[OptionContract]:
         """
         Convert yfinance DataFrame (calls or puts) to OptionContract objects.
-        This method is resilient to schema differences across yfinance versions.
+        Each column is coerced once (vectorized) instead of per row; missing columns
+        or bad values become None, so this stays resilient to schema differences
+        across yfinance versions.
         """
         out: List[OptionContract] = []
-        for row in df.itertuples(index=False):
-            # Extract symbol and strike robustly
-            try:
-                symbol = getattr(row, "contractSymbol", None) or getattr(row, "symbol", None)
-                strike_raw = getattr(row, "strike", None)
-                if strike_raw is None:
-                    logger.debug("Skipping row with missing strike: %r", row)
-                    continue
-                strike = float(strike_raw)
-            except Exception:
-                logger.debug("Skipping invalid row: %r", row)
+        if df is None or len(df) == 0:
+            return out
+
+        # Column-wise extraction: one pandas -> NumPy crossing per field
+        if "contractSymbol" in df.columns:
+            symbols = df["contractSymbol"].tolist()
+        elif "symbol" in df.columns:
+            symbols = df["symbol"].tolist()
+        else:
+            symbols = [None] * len(df)
+        strikes = self._numeric_column(df, "strike", clip_negative=False)
+        bids = self._numeric_column(df, "bid")
+        asks = self._numeric_column(df, "ask")
+        lasts = self._numeric_column(df, "lastPrice")
+        lasts = np.where(np.isnan(lasts) | (lasts == 0), self._numeric_column(df, "last"), lasts)
+        volumes = self._numeric_column(df, "volume")
+        open_interests = self._numeric_column(df, "openInterest")
+
+        # Mid for the whole column: bid/ask average, falling back to last trade
+        mids = np.where(np.isfinite(bids) & np.isfinite(asks), 0.5 * (bids + asks), lasts)
+
+        # Moneyness for the whole column; maturity is the same for every row of this expiry
+        moneyness = strikes * (1.0 / spot) if spot is not None and spot > 0 else np.full(len(df), np.nan)
+        if maturity_years is None:
+            maturity_years = self._maturity_years(expiry)
+
+        for symbol, strike, bid, ask, last, mid, volume, open_interest, mny in zip(
+            symbols,
+            strikes.tolist(),
+            bids.tolist(),
+            asks.tolist(),
+            lasts.tolist(),
+            mids.tolist(),
+            volumes.tolist(),
+            open_interests.tolist(),
+            moneyness.tolist(),
+        ):
+            if strike != strike:
+                logger.debug("Skipping row with missing/invalid strike (symbol %r)", symbol)
                 continue
 
-            bid = self._to_float(getattr(row, "bid", None))
-            ask = self._to_float(getattr(row, "ask", None))
-            last = self._to_float(getattr(row, "lastPrice", None)) or self._to_float(getattr(row, "last", None))
-            volume = self._to_int(getattr(row, "volume", None))
-            open_interest = self._to_int(getattr(row, "openInterest", None))
-
             c = OptionContract(
                 symbol=symbol,
                 underlying=underlying,
                 expiry=expiry,
                 strike=strike,
                 option_type=opt_type,
-                bid=bid,
-                ask=ask,
-                last=last,
-                volume=volume,
-                open_interest=open_interest,
+                bid=self._none_if_nan(bid),
+                ask=self._none_if_nan(ask),
+                last=self._none_if_nan(last),
+                volume=None if volume != volume else int(volume),
+                open_interest=None if open_interest != open_interest else int(open_interest),
+                mid=self._none_if_nan(mid),
+                moneyness=self._none_if_nan(mny),
+                maturity_years=maturity_years,
             )
 
-            # Derived fields that don't require heavy computation
-            c.compute_mid()
-            self._annotate_maturity(c, spot)
-
             # Placeholder: compute implied vol & vega if you have a BSM pricer available
             # try:
             #     if c.market_price is not None and c.maturity_years and c.maturity_years > 0 and spot:
@@ -220,88 +511,96 @@ class MarketDataLoader:
     # Conversion helpers
     # ---------------------------
     @staticmethod
-    def _to_float(v: Any) -> Optional[float]:
-        try:
-            if v is None:
-                return None
-            val = float(v)
-            if val < 0:
-                return None
-            return val
-        except Exception:
-            return None
+    def _numeric_column(df, name: str, clip_negative: bool = True) -> np.ndarray:
+        """Column `name` coerced to float64 (NaN if absent/invalid; negatives -> NaN unless clip_negative=False)."""
+        if name not in df.columns:
+            return np.full(len(df), np.nan)
+        col = pd.to_numeric(df[name], errors="coerce")
+        if clip_negative:
+            col = col.mask(col < 0)
+        return col.to_numpy(dtype=np.float64, na_value=np.nan)
 
     @staticmethod
-    def _to_int(v: Any) -> Optional[int]:
-        try:
-            if v is None:
-                return None
-            val = int(v)
-            if val < 0:
-                return None
-            return val
-        except Exception:
-            return None
+    def _none_if_nan(v: float) -> Optional[float]:
+        return None if v != v else v
 
     # ---------------------------
     # Spot / maturity helpers
     # ---------------------------
     @staticmethod
     def _safe_get_spot(tk: yf.Ticker) -> Optional[float]:
-        """Get latest close price from tk.history, return None on failure (no retries)."""
+        """
+        Latest spot from the lightweight quote endpoint (tk.fast_info), falling back
+        to the last close of tk.history; raises on failure (retries live in the caller).
+        """
+        try:
+            last = float(tk.fast_info["last_price"])
+            if last > 0 and np.isfinite(last):
+                return last
+        except Exception:
+            pass
+
         hist = tk.history(period="1d")
         if hist is None or hist.empty:
             raise ValueError("Empty history")
         return float(hist["Close"].iloc[-1])
 
     @staticmethod
-    def _annotate_maturity(contract: OptionContract, spot: Optional[float]) -> None:
-        """Compute moneyness and maturity_years in-place (if possible)."""
+    def _maturity_years(expiry: str) -> Optional[float]:
+        """Years from today (UTC) to `expiry` ("YYYY-MM-DD"), floored at 0; None if unparseable."""
         try:
-            if spot is not None and spot > 0:
-                contract.moneyness = contract.strike / spot
-        except Exception:
-            contract.moneyness = None
-
-        try:
-            expiry_dt = datetime.strptime(contract.expiry, "%Y-%m-%d").date()
+            expiry_dt = datetime.strptime(expiry, "%Y-%m-%d").date()
             today = datetime.utcnow().date()
             days = max((expiry_dt - today).days, 0)
-            contract.maturity_years = days / 365.0 if days > 0 else 0.0
+            return days / 365.0 if days > 0 else 0.0
         except Exception:
-            contract.maturity_years = None
+            return None
 
     # ---------------------------
     # Liquidity tagging & filtering
     # ---------------------------
-    def _is_liquid(self, c: OptionContract) -> bool:
-        """Return True if contract meets liquidity criteria defined in config."""
-        oi = c.open_interest or 0
-        vol = c.volume or 0
-        if oi < self.config.min_open_interest or vol < self.config.min_volume:
-            return False
-
-        # spread percentage check
-        if c.bid is not None and c.ask is not None and c.bid > 0:
-            spread_pct = (c.ask - c.bid) / c.bid
-            if spread_pct > self.config.max_spread_pct:
-                return False
+    def _liquidity_mask(self, chain: OptionChain) -> np.ndarray:
+        """
+        Boolean mask of contracts meeting the liquidity criteria in config,
+        evaluated on the chain's columns in one pass (missing OI / volume count as 0).
+        """
+        oi = np.nan_to_num(chain.ois, nan=0.0)
+        vol = np.nan_to_num(chain.volumes, nan=0.0)
+        mask = (oi >= self.config.min_open_interest) & (vol >= self.config.min_volume)
 
-        # If mid is none, enforce it
-        if c.mid is None:
-            return False
+        # spread percentage check (only where both sides are quoted and bid > 0)
+        quoted = np.isfinite(chain.bids) & np.isfinite(chain.asks) & (chain.bids > 0)
+        spread_pct = (chain.asks - chain.bids) / np.where(quoted, chain.bids, 1.0)
+        mask &= ~(quoted & (spread_pct > self.config.max_spread_pct))
 
-        return True
+        # If mid is none, enforce it
+        mask &= ~np.isnan(chain.mids)
+        return mask
 
-    def _tag_liquidity(self, chain: OptionChain) -> None:
+    def _tag_liquidity(self, chain: OptionChain, mask: Optional[np.ndarray] = None) -> None:
         """
-        Non-destructively tag contracts with attribute `is_liquid` (True/False).
+        Non-destructively tag contracts with field `is_liquid` (True/False).
         This leaves the original chain intact but adds metadata useful for UI.
         """
-        for c in chain.contracts:
-            setattr(c, "is_liquid", self._is_liquid(c))
+        chain.is_liquid = self._liquidity_mask(chain) if mask is None else mask
 
-    def _filter_chain(self, chain: OptionChain) -> OptionChain:
+    def _filter_chain(self, chain: OptionChain, mask: Optional[np.ndarray] = None) -> OptionChain:
         """Return a new OptionChain with only liquid contracts (destructive)."""
-        filtered = [c for c in chain.contracts if self._is_liquid(c)]
-        return OptionChain(underlying=chain.underlying, as_of=chain.as_of, spot=chain.spot, contracts=filtered)
+        return chain.select(self._liquidity_mask(chain) if mask is None else mask)
+
+
+@_streamlit_cache
+def load_option_chain(
+    ticker: str,
+    filter: bool = True,
+    tag_liquidity: bool = False,
+    config: Optional[LoaderConfig] = None,
+) -> OptionChain:
+    """
+    `MarketDataLoader(config).get_option_chain(...)`, memoized per argument set for
+    10 minutes by st.cache_data when Streamlit is installed, so repeat UI interactions
+    skip the expiry fan-out. The loader is built inside, so only hashable arguments
+    (ticker, flags, LoaderConfig) enter the cache key; the returned OptionChain is
+    pickled by Streamlit, so treat it as read-only.
+    """
+    return MarketDataLoader(config).get_option_chain(ticker, filter=filter, tag_liquidity=tag_liquidity)
@@ -1,8 +1,11 @@
 # data_processors/iv_surface_builder.py
 
+from operator import attrgetter
+from typing import Iterable, List
+
+import numpy as np
 import pandas as pd
-from typing import List
-from src.option_pricer.models.option import OptionContract
+from src.option_pricer.models.option import OptionChain, OptionContract, _TYPE_LABELS
 
 class IVSurfaceBuilder:
     """
@@ -15,19 +18,46 @@ class IVSurfaceBuilder:
         """Convert list of OptionContract objects into a flat DataFrame.
 
         Uses `maturity_years` from each contract to ensure time is in years.
+        Built column-wise (one attrgetter pass, no per-row dicts).
+        """
+        get = attrgetter("expiry", "maturity_years", "strike", "implied_vol", "option_type")
+        columns = list(zip(*map(get, contracts))) or [()] * 5
+        return pd.DataFrame(
+            {
+                name: list(col)
+                for name, col in zip(("expiry", "maturity_years", "strike", "iv", "type"), columns)
+            }
+        )
+
+    @staticmethod
+    def chain_to_dataframe(chain: OptionChain) -> pd.DataFrame:
+        """Same frame as `to_dataframe`, read straight from an OptionChain's column arrays.
+
+        `iv` comes from `chain.implied_vols` (NaN where unsolved), e.g. as filled by
+        OptionChainProcessor.process_option_chain.
+        """
+        return pd.DataFrame(
+            {
+                "expiry": chain.expiry_dates.tolist(),
+                "maturity_years": chain.maturity_years,
+                "strike": chain.strikes,
+                "iv": chain.implied_vols,
+                "type": _TYPE_LABELS[chain.types].tolist(),
+            }
+        )
+
+    @staticmethod
+    def to_dataframe_incremental(chunks: Iterable[List[OptionContract]]) -> pd.DataFrame:
+        """Same frame as `to_dataframe`, built from a stream of contract lists (e.g. expiry shards).
+
+        Each chunk is appended to growing NumPy columns as it arrives, so the
+        contracts themselves can be dropped once consumed. Chunks must already carry
+        implied_vol (see `IVFrameAccumulator`).
         """
-        rows = []
-        for c in contracts:
-            rows.append(
-                {
-                    "expiry": c.expiry,
-                    "maturity_years": c.maturity_years,
-                    "strike": c.strike,
-                    "iv": c.implied_vol,
-                    "type": c.option_type,
-                }
-            )
-        return pd.DataFrame(rows)
+        acc = IVFrameAccumulator()
+        for chunk in chunks:
+            acc.append(chunk)
+        return acc.to_dataframe()
 
     @staticmethod
     def build_iv_surfaces(df: pd.DataFrame):
@@ -36,10 +66,10 @@ class IVSurfaceBuilder:
         Expects columns: ['strike', 'maturity_years', 'type', 'iv'].
         """
 
-        # type cleaning
-        df["strike"] = pd.to_numeric(df["strike"], errors="coerce")
-        df["maturity_years"] = pd.to_numeric(df["maturity_years"], errors="coerce")
-        df["iv"] = pd.to_numeric(df["iv"], errors="coerce")
+        # type cleaning (only for columns that did not come in numeric already)
+        for col in ("strike", "maturity_years", "iv"):
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors="coerce")
 
         df = df.dropna(subset=["strike", "maturity_years", "iv", "type"])
 
@@ -48,30 +78,79 @@ class IVSurfaceBuilder:
         puts = df[df["type"].str.upper() == "P"]
 
         # pivot matrices: strike x maturity (years)
-        call_surface = (
-            calls.pivot_table(
-                index="strike",
-                columns="maturity_years",
-                values="iv",
-                aggfunc="mean",
-            )
-            .sort_index(axis=0)
-            .sort_index(axis=1)
-            if not calls.empty
-            else pd.DataFrame()
-        )
-
-        put_surface = (
-            puts.pivot_table(
-                index="strike",
-                columns="maturity_years",
-                values="iv",
-                aggfunc="mean",
-            )
-            .sort_index(axis=0)
-            .sort_index(axis=1)
-            if not puts.empty
-            else pd.DataFrame()
-        )
+        call_surface = IVSurfaceBuilder._pivot_surface(calls)
+        put_surface = IVSurfaceBuilder._pivot_surface(puts)
 
         return call_surface, put_surface
+
+    @staticmethod
+    def _pivot_surface(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        strike x maturity_years matrix of IVs, sorted on both axes.
+        Plain `pivot` when each (strike, maturity) appears once (the usual case);
+        duplicates are averaged via groupby + unstack. Cheaper than pivot_table.
+        """
+        if df.empty:
+            return pd.DataFrame()
+        try:
+            surface = df.pivot(index="strike", columns="maturity_years", values="iv")
+        except ValueError:
+            # duplicate (strike, maturity) pairs -> average them
+            surface = df.groupby(["strike", "maturity_years"])["iv"].mean().unstack("maturity_years")
+        return surface.sort_index(axis=0).sort_index(axis=1)
+
+
+class IVFrameAccumulator:
+    """
+    Incremental builder for the `IVSurfaceBuilder.to_dataframe` frame.
+    Numeric columns live in preallocated float64 arrays that double when full;
+    missing values (None) are stored as NaN.
+    Shards need implied_vol filled before they are appended (rows without it are
+    dropped by build_iv_surfaces), e.g. through the loader's `solve_iv` hook.
+    Usage:
+        processor = OptionChainProcessor()
+        acc = IVFrameAccumulator()
+        for shard in loader.get_option_chain_streaming("AAPL", solve_iv=processor.solve_contracts):
+            acc.append(shard)
+        calls, puts = IVSurfaceBuilder.build_iv_surfaces(acc.to_dataframe())
+    """
+
+    _GET = attrgetter("maturity_years", "strike", "implied_vol")
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, int(capacity))
+        self._numeric = np.empty((capacity, 3), dtype=np.float64)   # maturity_years, strike, iv
+        self._expiry: List[str] = []
+        self._type: List[str] = []
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, contracts: List[OptionContract]) -> None:
+        """Append one chunk of contracts."""
+        m = len(contracts)
+        if m == 0:
+            return
+        end = self._n + m
+        if end > self._numeric.shape[0]:
+            grown = np.empty((max(end, 2 * self._numeric.shape[0]), 3), dtype=np.float64)
+            grown[: self._n] = self._numeric[: self._n]
+            self._numeric = grown
+        self._numeric[self._n:end] = np.array(list(map(self._GET, contracts)), dtype=np.float64)
+        self._expiry.extend(map(attrgetter("expiry"), contracts))
+        self._type.extend(map(attrgetter("option_type"), contracts))
+        self._n = end
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Columns ['expiry', 'maturity_years', 'strike', 'iv', 'type'] for everything appended so far."""
+        numeric = self._numeric[: self._n]
+        return pd.DataFrame(
+            {
+                "expiry": self._expiry,
+                "maturity_years": numeric[:, 0].copy(),
+                "strike": numeric[:, 1].copy(),
+                "iv": numeric[:, 2].copy(),
+                "type": self._type,
+            }
+        )
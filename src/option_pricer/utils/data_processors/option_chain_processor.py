@@ -8,33 +8,43 @@ and computes:
 - Implied volatility
 - Greeks (optional)
 
+`process_chain` takes one expiry slice (single tau); `process_chain_vectorized`
+takes the whole chain (row dicts or a DataFrame) with a per-row "tau";
+`process_option_chain` reads an OptionChain's column arrays directly;
+`solve_contracts` fills implied_vol on a list of OptionContracts (e.g. streamed shards).
+
 Returns a list of OptionPoint dataclasses (to surface builder for heatmapping).
 
 """
 
 from dataclasses import dataclass
-from typing import Literal, List, Any, Optional
+from operator import attrgetter
+from typing import Literal, List, Any, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
 
-from src.option_pricer.utils.pricers.black_scholes import (
-    bsm_delta,
-    bsm_gamma,
-    bsm_theta,
-    bsm_rho,
-)
-from src.option_pricer.utils.pricers.implied_volatility import implied_volatility
+from src.option_pricer.models.option import OptionChain, OptionContract, _TYPE_LABELS
+from src.option_pricer.utils.pricers.black_scholes import bsm_all_greeks
+from src.option_pricer.utils.pricers.implied_volatility import implied_volatility_vec
+
+try:  # numba is optional: fall back to the NumPy solver without it
+    from src.option_pricer.utils.pricers._iv_numba import iv_greeks_kernel
+except ImportError:
+    iv_greeks_kernel = None
 
 
 OptionType = Literal["C", "P"]
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionPoint:
     symbol: str
     expiry: str
     strike: float
     type: OptionType
-    bid: float
-    ask: float
+    bid: Optional[float]
+    ask: Optional[float]
     mid: float
     implied_vol: Optional[float]
     delta: Optional[float]
@@ -43,6 +53,13 @@ class OptionPoint:
     rho: Optional[float]
 
 
+def _none_where_unsolved(values: np.ndarray, solved: np.ndarray) -> List[Optional[float]]:
+    """Python floats where `solved` (or present), None elsewhere (OptionPoint's missing-value convention)."""
+    out = values.astype(object)
+    out[~solved] = None
+    return out.tolist()
+
+
 class OptionChainProcessor:
     def __init__(self, risk_free_rate: float = 0.05, dividend_yield: float = 0.00):
         self.r = risk_free_rate
@@ -66,44 +83,148 @@ class OptionChainProcessor:
         ]
         """
 
+        mids = [
+            (row["bid"] + row["ask"]) / 2 if (row["bid"] and row["ask"]) else None
+            for row in raw_chain
+        ]
+        prices = np.array([m if m and m > 0 else np.nan for m in mids], dtype=float)
+
+        return self._build_points(
+            symbols=[row["symbol"] for row in raw_chain],
+            expiries=[row["expiry"] for row in raw_chain],
+            strikes=np.array([row["strike"] for row in raw_chain], dtype=float),
+            types=[row["type"] for row in raw_chain],
+            bids=[row["bid"] for row in raw_chain],
+            asks=[row["ask"] for row in raw_chain],
+            mids=mids,
+            prices=prices,
+            taus=np.full(len(raw_chain), tau, dtype=float),
+            spot=spot,
+        )
+
+    def process_chain_vectorized(
+        self, raw_chain: Union[List[dict], pd.DataFrame], spot: float
+    ) -> List[OptionPoint]:
+        """
+        Whole-chain entrypoint: same rows as `process_chain` plus a per-row "tau",
+        so every expiry is solved in a single vectorized IV call.
+        Accepts the row dicts directly (no DataFrame round-trip) or a DataFrame.
+        """
+        def column(name: str) -> List[Any]:
+            if isinstance(raw_chain, pd.DataFrame):
+                return raw_chain[name].tolist()
+            return [row[name] for row in raw_chain]
+
+        bids = np.array(column("bid"), dtype=float)
+        asks = np.array(column("ask"), dtype=float)
+        quoted = np.isfinite(bids) & np.isfinite(asks) & (bids != 0) & (asks != 0)
+        mids = np.where(quoted, (bids + asks) / 2, np.nan)
+        prices = np.where(mids > 0, mids, np.nan)
+
+        return self._build_points(
+            symbols=column("symbol"),
+            expiries=column("expiry"),
+            strikes=np.array(column("strike"), dtype=float),
+            types=column("type"),
+            bids=_none_where_unsolved(bids, ~np.isnan(bids)),
+            asks=_none_where_unsolved(asks, ~np.isnan(asks)),
+            mids=[float(m) if quoted_i else None for m, quoted_i in zip(mids, quoted)],
+            prices=prices,
+            taus=np.array(column("tau"), dtype=float),
+            spot=spot,
+        )
+
+    def process_option_chain(self, chain: OptionChain) -> List[OptionPoint]:
+        """
+        Struct-of-arrays entrypoint: every contract of `chain` with maturity > 0,
+        taken straight from its column arrays (no row dicts), tau = chain.maturity_years.
+        Solved IVs are also written back into `chain.implied_vols` (NaN where unsolved),
+        so the chain can feed IVSurfaceBuilder.chain_to_dataframe without the points.
+        """
+        taus = np.nan_to_num(chain.maturity_years, nan=0.0)
+        keep = taus > 0
+        bids = chain.bids[keep]
+        asks = chain.asks[keep]
+        quoted = np.isfinite(bids) & np.isfinite(asks) & (bids != 0) & (asks != 0)
+        mids = np.where(quoted, (bids + asks) / 2, np.nan)
+
+        points = self._build_points(
+            symbols=chain.symbols[keep].tolist(),
+            expiries=chain.expiry_dates[keep].tolist(),
+            strikes=chain.strikes[keep],
+            types=_TYPE_LABELS[chain.types[keep]].tolist(),
+            # Missing quotes stay None on the points (NaN in the columns), not 0.0
+            bids=_none_where_unsolved(bids, ~np.isnan(bids)),
+            asks=_none_where_unsolved(asks, ~np.isnan(asks)),
+            mids=[float(m) if quoted_i else None for m, quoted_i in zip(mids, quoted)],
+            prices=np.where(mids > 0, mids, np.nan),
+            taus=taus[keep],
+            spot=chain.spot or 0.0,
+        )
+
+        implied_vols = np.full(len(chain), np.nan)
+        implied_vols[keep] = np.array([p.implied_vol for p in points], dtype=float)
+        chain.implied_vols = implied_vols
+        return points
+
+    def solve_contracts(self, contracts: List[OptionContract], spot: Optional[float]) -> List[OptionContract]:
+        """
+        Fills `implied_vol` in place on OptionContracts that already carry mid and
+        maturity_years (as the loader's shards do), solved from mid in one vectorized call.
+        Unsolved, unquoted or expired contracts get None. Without a spot nothing is solved.
+        Matches the `solve_iv` hook of MarketDataLoader.get_option_chain_streaming.
+        """
+        if not contracts:
+            return contracts
+        if not spot:
+            for c in contracts:
+                c.implied_vol = None
+            return contracts
+
+        mids, strikes, taus, types = zip(*map(attrgetter("mid", "strike", "maturity_years", "option_type"), contracts))
+        prices = np.array(mids, dtype=float)
+        taus = np.nan_to_num(np.array(taus, dtype=float), nan=0.0)
+        prices = np.where((prices > 0) & (taus > 0), prices, np.nan)
+        is_call = np.array([str(t).upper().startswith("C") for t in types], dtype=bool)
+
+        ivs = self._solve_iv(prices, np.array(strikes, dtype=float), is_call, float(spot), taus)
+        for c, iv in zip(contracts, _none_where_unsolved(ivs, np.isfinite(ivs))):
+            c.implied_vol = iv
+        return contracts
+
+    def _build_points(
+        self,
+        symbols: List[str],
+        expiries: List[str],
+        strikes: np.ndarray,
+        types: List[Any],
+        bids: List[Any],
+        asks: List[Any],
+        mids: List[Optional[float]],
+        prices: np.ndarray,
+        taus: np.ndarray,
+        spot: float,
+    ) -> List[OptionPoint]:
+        """Solve IV and Greeks for the whole batch at once, then wrap rows as OptionPoints."""
         processed: List[OptionPoint] = []
 
-        for row in raw_chain:
-            bid = row["bid"]
-            ask = row["ask"]
-            mid = (bid + ask) / 2 if (bid and ask) else None
-
-            # 1. Compute Implied Vol
-            iv = None
-            if mid and mid > 0:
-                try:
-                    iv = implied_volatility(
-                        price=mid,
-                        S=spot,
-                        K=row["strike"],
-                        r=self.r,
-                        q=self.q,
-                        tau=tau,
-                        option_type=row["type"],
-                    )
-                except Exception:
-                    iv = None
-
-            # 2. Greeks (only compute if IV succeeded)
-            if iv:
-                delta = bsm_delta(spot, row["strike"], self.r, self.q, iv, tau, row["type"])
-                gamma = bsm_gamma(spot, row["strike"], self.r, self.q, iv, tau)
-                theta = bsm_theta(spot, row["strike"], self.r, self.q, iv, tau, row["type"])
-                rho = bsm_rho(spot, row["strike"], self.r, self.q, iv, tau, row["type"])
-            else:
-                delta = gamma = theta = rho = None
+        # 1.+2. Implied vol and Greeks for the whole batch at once (Greeks only kept where IV succeeded)
+        is_call = np.array([str(t).upper().startswith("C") for t in types], dtype=bool)
+        columns = self._solve_iv_and_greeks(prices, strikes, is_call, spot, taus)
+        ivs = columns[0]
+        # NaN = no IV; 0.0 (a quote with no time value) is a solved IV, as in the solvers
+        solved = np.isfinite(ivs)
+        iv_col, deltas, gammas, thetas, rhos = (_none_where_unsolved(col, solved) for col in columns)
 
+        for symbol, expiry, strike, opt_type, bid, ask, mid, iv, delta, gamma, theta, rho in zip(
+            symbols, expiries, strikes.tolist(), types, bids, asks, mids, iv_col, deltas, gammas, thetas, rhos
+        ):
             processed.append(
                 OptionPoint(
-                    symbol=row["symbol"],
-                    expiry=row["expiry"],
-                    strike=row["strike"],
-                    type=row["type"],
+                    symbol=symbol,
+                    expiry=expiry,
+                    strike=strike,
+                    type=opt_type,
                     bid=bid,
                     ask=ask,
                     mid=mid,
@@ -116,3 +237,40 @@ class OptionChainProcessor:
             )
 
         return processed
+
+    def _solve_iv_and_greeks(
+        self, prices: np.ndarray, strikes: np.ndarray, is_call: np.ndarray, spot: float, taus: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (iv, delta, gamma, theta, rho) for a batch. With numba, one fused parallel kernel
+        solves IV and evaluates Greeks per contract; only rows it leaves unsolved go
+        through the NumPy solver + bsm_all_greeks. Without numba, solve then bsm_all_greeks.
+        """
+        n = len(prices)
+        if iv_greeks_kernel is None:
+            try:
+                ivs = self._solve_iv(prices, strikes, is_call, spot, taus)
+            except Exception:
+                ivs = np.full(n, np.nan)
+            greeks = bsm_all_greeks(spot, strikes, self.r, self.q, ivs, taus, is_call)
+            return ivs, greeks["delta"], greeks["gamma"], greeks["theta"], greeks["rho"]
+
+        out = tuple(np.empty(n) for _ in range(5))
+        iv_greeks_kernel(prices, float(spot), strikes, float(self.r), float(self.q), taus, is_call, *out, 30, 1e-6)
+
+        pending = np.isnan(out[0]) & np.isfinite(prices)
+        if pending.any():
+            try:
+                ivs = implied_volatility_vec(
+                    prices[pending], spot, strikes[pending], self.r, self.q, taus[pending], is_call[pending]
+                )
+            except Exception:
+                ivs = np.full(int(pending.sum()), np.nan)
+            greeks = bsm_all_greeks(spot, strikes[pending], self.r, self.q, ivs, taus[pending], is_call[pending])
+            for col, values in zip(out, (ivs, greeks["delta"], greeks["gamma"], greeks["theta"], greeks["rho"])):
+                col[pending] = values
+        return out
+
+    def _solve_iv(self, prices: np.ndarray, strikes: np.ndarray, is_call: np.ndarray, spot: float, taus: np.ndarray) -> np.ndarray:
+        """IV for a batch (per-row taus): NumPy rational solver + Brent fill (no Greeks)."""
+        return implied_volatility_vec(prices, spot, strikes, self.r, self.q, taus, is_call)
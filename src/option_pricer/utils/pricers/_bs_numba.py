@@ -0,0 +1,311 @@
+# pricers/_bs_numba.py
+"""
+Numba scalar Black-Scholes kernels for the root-finding inner loops.
+
+Functions:
+- bs_price(S, K, r, q, sigma, tau, is_call)
+- price_bounds(S, K, r, q, tau, is_call) -> (lower, upper)
+- halley_step(diff, vega, d1, d2, sigma)
+- corrado_miller_guess(price, s_disc, k_disc, log_fk, tau, is_call)
+- iv_newton_scalar(market_price, S, K, r, q, tau, is_call, initial_vol, tol, max_iter)
+- iv_householder_scalar(market_price, S, K, r, q, tau, is_call, tol)  (fixed three steps, NaN on a miss)
+- iv_brent_scalar(market_price, S, K, r, q, tau, is_call, low, high, tol, max_iter)
+
+Inputs are assumed non-degenerate (tau, sigma, S, K > 0); the Python callers
+keep the edge-case handling. Every kernel is pinned to one float64 / bool
+signature, so it is compiled (or loaded from the on-disk cache) at import and
+the first call pays no JIT. Kernels release the GIL (nogil), so threaded
+callers solve in parallel. Importing this module requires numba; callers
+should guard the import.
+"""
+
+from __future__ import annotations
+
+import math
+
+from numba import njit
+
+from src.option_pricer.utils.pricers._constants import _D1_MAX, _INV_SQRT2, _INV_SQRT_2PI, _VEGA_FLOOR
+
+# Every fast-math flag except nnan/ninf: NaN is the "no IV" sentinel and must survive.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# scipy.optimize.brentq's default bracket tolerances (xtol, rtol = 4 eps)
+_BRENT_XTOL = 2e-12
+_BRENT_RTOL = 4.0 * 2.220446049250313e-16
+
+
+@njit("f8(f8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF via erfc (accurate in the left tail, unlike 1 + erf)."""
+    return 0.5 * math.erfc(-x * _INV_SQRT2)
+
+
+@njit("f8(f8, f8, f8, f8, f8, f8, b1)", cache=True, nogil=True, fastmath=_FASTMATH)
+def bs_price(S, K, r, q, sigma, tau, is_call):
+    """Black-Scholes price; theta = +1 call / -1 put."""
+    theta = 1.0 if is_call else -1.0
+    sqrt_tau = math.sqrt(tau)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
+    d2 = d1 - sigma * sqrt_tau
+    return theta * (S * math.exp(-q * tau) * _norm_cdf(theta * d1) - K * math.exp(-r * tau) * _norm_cdf(theta * d2))
+
+
+@njit("f8(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def _bs_price_from_sigma(sigma, log_sk, r, q, tau, sqrt_tau, df_r, df_q, S, K, theta):
+    """Black-Scholes price from precomputed log(S/K), sqrt(tau) and discount factors (only d1, d2, N(.) per call)."""
+    d1 = (log_sk + (r - q + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
+    d2 = d1 - sigma * sqrt_tau
+    return theta * (S * df_q * _norm_cdf(theta * d1) - K * df_r * _norm_cdf(theta * d2))
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, f8, f8, b1)", cache=True, nogil=True, fastmath=_FASTMATH)
+def price_bounds(S, K, r, q, tau, is_call):
+    """No-arbitrage (lower, upper) price bounds under continuous rates; see `implied_volatility._price_bounds_py`."""
+    df_r = math.exp(-r * tau)
+    df_q = math.exp(-q * tau)
+    if is_call:
+        return max(0.0, S * df_q - K * df_r), S * df_q
+    return max(0.0, K * df_r - S * df_q), K * df_r
+
+
+@njit("f8(f8, f8, f8, f8, f8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def halley_step(diff, vega, d1, d2, sigma):
+    """
+    Newton step diff / vega with Halley's correction, using vomma = vega * d1 * d2 / sigma
+    (cubic instead of quadratic convergence); plain Newton where the correction is >= 1.
+    """
+    step = diff / vega
+    adj = 0.5 * step * d1 * d2 / sigma
+    if abs(adj) < 1.0:
+        step = step / (1.0 - adj)
+    return step
+
+
+@njit("f8(f8, f8, f8, f8, f8, b1)", cache=True, nogil=True, fastmath=_FASTMATH)
+def corrado_miller_guess(price, s_disc, k_disc, log_fk, tau, is_call):
+    """
+    Corrado-Miller closed-form IV (puts via parity) as the Newton seed, from the discounted
+    spot / strike and ln(F/K) the solvers already hold; Manaster-Koehler clipped to [0.05, 2.0]
+    where it is not positive. See `implied_volatility._corrado_miller_guess`.
+    Shared by `iv_newton_scalar` and the batch kernels in `_iv_numba`.
+    """
+    h = (price if is_call else price + s_disc - k_disc) - 0.5 * (s_disc - k_disc)
+    disc = h * h - (s_disc - k_disc) ** 2 / math.pi
+    guess = math.sqrt(2.0 * math.pi / tau) / (s_disc + k_disc) * (h + math.sqrt(max(disc, 0.0)))
+    if guess > 0.0 and math.isfinite(guess):
+        return guess
+    guess = math.sqrt(abs(2.0 * log_fk) / max(tau, 1e-8))
+    return min(max(guess, 0.05), 2.0)
+
+
+@njit("f8(f8, f8, f8, f8, f8, f8, b1, f8, f8, i8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def iv_newton_scalar(market_price, S, K, r, q, tau, is_call, initial_vol, tol, max_iter):
+    """
+    Newton-Raphson IV (Halley-corrected steps) for one contract, entirely in compiled code;
+    the only compiled Newton loop (the `_iv_numba` batch kernels call it per element).
+    Same stopping rules and NaN failure sentinel as `implied_vol_newton`; seeded with
+    `corrado_miller_guess` unless `initial_vol` is positive (pass NaN for "no guess").
+    """
+    theta = 1.0 if is_call else -1.0
+    sqrt_tau = math.sqrt(tau)
+    s_disc = S * math.exp(-q * tau)
+    k_disc = K * math.exp(-r * tau)
+    log_fk = math.log(S / K) + (r - q) * tau  # ln(F / K)
+    vega_floor = _VEGA_FLOOR * max(1.0, S)
+
+    sigma = initial_vol if initial_vol > 0.0 else corrado_miller_guess(market_price, s_disc, k_disc, log_fk, tau, is_call)
+    for _ in range(max_iter):
+        # One total vol shared by d1, d2 and vega
+        tvol = sigma * sqrt_tau
+        d1 = log_fk / tvol + 0.5 * tvol
+        d2 = d1 - tvol
+        diff = theta * (s_disc * _norm_cdf(theta * d1) - k_disc * _norm_cdf(theta * d2)) - market_price
+
+        # Convergence reached
+        if abs(diff) < tol:
+            return sigma
+
+        # Vega too small (or d1 in the tails) -> caller falls back
+        vega = s_disc * sqrt_tau * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        if vega < vega_floor or abs(d1) > _D1_MAX:
+            return math.nan
+
+        # Halley step; stop once it is small relative to sigma, don't allow negative sigma
+        step = halley_step(diff, vega, d1, d2, sigma)
+        converged = abs(step) < tol * max(abs(sigma), 1e-8)
+        sigma = sigma - step
+        if converged and sigma > 0.0:
+            return sigma
+        if sigma <= 0.0:
+            sigma = 1e-6
+
+    return math.nan
+
+
+@njit("f8(f8, f8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def _normalized_black_call(x, s):
+    """Normalized Black call b(x, s) = e^{x/2} N(x/s + s/2) - e^{-x/2} N(x/s - s/2)."""
+    return math.exp(0.5 * x) * _norm_cdf(x / s + 0.5 * s) - math.exp(-0.5 * x) * _norm_cdf(x / s - 0.5 * s)
+
+
+@njit("f8(f8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def _norm_ppf(p):
+    """Inverse standard normal CDF (Acklam's rational approximation, rel. error ~1e-9)."""
+    if p < 0.02425:
+        t = math.sqrt(-2.0 * math.log(p))
+        return (((((-7.784894002430293e-03 * t - 3.223964580411365e-01) * t - 2.400758277161838e+00) * t
+                  - 2.549732539343734e+00) * t + 4.374664141464968e+00) * t + 2.938163982698783e+00) / (
+            (((7.784695709041462e-03 * t + 3.224671290700398e-01) * t + 2.445134137142996e+00) * t
+             + 3.754408661907416e+00) * t + 1.0
+        )
+    if p > 0.97575:
+        return -_norm_ppf(1.0 - p)
+    u = p - 0.5
+    t = u * u
+    return (((((-3.969683028665376e+01 * t + 2.209460984245205e+02) * t - 2.759285104469687e+02) * t
+              + 1.383577518672690e+02) * t - 3.066479806614716e+01) * t + 2.506628277459239e+00) * u / (
+        ((((-5.447609879822406e+01 * t + 1.615858368580409e+02) * t - 1.556989798598866e+02) * t
+          + 6.680131188771972e+01) * t - 1.328068155288572e+01) * t + 1.0
+    )
+
+
+@njit("f8(f8, f8, f8, f8, f8, f8, b1, f8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def iv_householder_scalar(market_price, S, K, r, q, tau, is_call, tol):
+    """
+    Jäckel-style IV for one contract: normalized coordinates, a branch-specific closed-form
+    guess and exactly three Householder(3) steps (no convergence test inside the loop).
+
+    With F = S e^{(r-q) tau}, x = ln(F / K) and b = price e^{r tau} / sqrt(F K), the time value
+    is mapped onto an out-of-the-money normalized call (x <= 0) and solved for s = sigma sqrt(tau):
+      - upper branch (beta >= b(s_c), s_c = sqrt(2|x|)): on b(s) - beta, from 2 N^{-1}((1 + beta e^{-x/2}) / 2)
+      - lower branch: on ln b(s) - ln beta, from the larger of the asymptotic |x| / sqrt(-2 ln beta)
+        and the tangent of b at s_c
+    Returns NaN if the price is outside the no-arbitrage bounds or the final iterates miss it
+    by tol or more, so the caller can fall back to `iv_newton_scalar`.
+    """
+    theta = 1.0 if is_call else -1.0
+    fwd = S * math.exp((r - q) * tau)
+    scale = math.exp(-r * tau) * math.sqrt(fwd * K)
+    x = math.log(fwd / K)
+    e_half = math.exp(0.5 * x)
+    beta = market_price / scale - max(theta * (e_half - 1.0 / e_half), 0.0)
+
+    # Time value of any option equals the normalized OTM call at -|x|
+    x = -abs(x)
+    if not (0.0 < beta < math.exp(0.5 * x)):
+        return math.nan
+
+    s_c = math.sqrt(-2.0 * x)
+    b_c = _normalized_black_call(x, s_c) if s_c > 0.0 else 0.0
+    upper = beta >= b_c
+    if upper:
+        s = max(s_c, 2.0 * _norm_ppf(0.5 * (1.0 + beta * math.exp(-0.5 * x))))
+    else:
+        # b is convex here, so the tangent at s_c lands right of the root: take the larger guess
+        v_c = _INV_SQRT_2PI * math.exp(0.5 * x)
+        s = min(s_c, max(-x / math.sqrt(-2.0 * math.log(beta)), s_c - (b_c - beta) / v_c))
+    log_beta = math.log(beta)
+
+    for _ in range(3):
+        b = _normalized_black_call(x, s)
+        v = _INV_SQRT_2PI * math.exp(-0.5 * (x * x / (s * s) + 0.25 * s * s))
+        # Closed-form b''/b' and b'''/b'
+        h2 = x * x / (s * s * s) - 0.25 * s
+        h3 = h2 * h2 - 3.0 * x * x / (s * s * s * s) - 0.25
+        if upper:
+            nu = (beta - b) / v
+            s = max(s + nu * (1.0 + 0.5 * h2 * nu) / (1.0 + nu * (h2 + h3 * nu / 6.0)), s_c)
+        else:
+            # Same update on ln b(s), which is near-linear where b is exponentially flat
+            if b <= 0.0:
+                return math.nan
+            w = v / b
+            a = h2 - w
+            c = h3 - 3.0 * h2 * w + 2.0 * w * w
+            nu = (log_beta - math.log(b)) / w
+            s = min(s + nu * (1.0 + 0.5 * a * nu) / (1.0 + nu * (a + c * nu / 6.0)), s_c)
+
+    # Accept if the iterate before the last step already priced within tol (the last step only refines)
+    if not (s > 0.0) or abs(b - beta) * scale >= tol:
+        return math.nan
+    return s / math.sqrt(tau)
+
+
+@njit("f8(f8, f8, f8, f8, f8, f8, b1, f8, f8, f8, i8)", cache=True, nogil=True, fastmath=_FASTMATH)
+def iv_brent_scalar(market_price, S, K, r, q, tau, is_call, low, high, tol, max_iter):
+    """
+    Bracketed IV root on [low, high] by Brent's method (scipy's brentq: secant / inverse
+    quadratic interpolation steps, bisection whenever a trial step leaves the bracket or
+    shrinks too slowly). Stops once the price is within tol, or once the bracket is down to
+    scipy's default xtol/rtol.
+
+    Where [low, high] does not bracket the price, returns the endpoint bisection would
+    converge to (low if even `low` overprices, else high).
+    """
+    # sigma-independent terms, evaluated once per solve
+    theta = 1.0 if is_call else -1.0
+    log_sk = math.log(S / K)
+    sqrt_tau = math.sqrt(tau)
+    df_r = math.exp(-r * tau)
+    df_q = math.exp(-q * tau)
+
+    x_pre = low
+    x_cur = high
+    f_pre = _bs_price_from_sigma(x_pre, log_sk, r, q, tau, sqrt_tau, df_r, df_q, S, K, theta) - market_price
+    f_cur = _bs_price_from_sigma(x_cur, log_sk, r, q, tau, sqrt_tau, df_r, df_q, S, K, theta) - market_price
+    if f_pre * f_cur > 0.0:
+        return low if f_pre > 0.0 else high
+    if f_pre == 0.0:
+        return x_pre
+
+    x_blk = 0.0
+    f_blk = 0.0
+    s_pre = 0.0
+    s_cur = 0.0
+    for _ in range(max_iter):
+        if f_pre != 0.0 and f_cur != 0.0 and (f_pre < 0.0) != (f_cur < 0.0):
+            # Root bracketed by [x_pre, x_cur]: x_pre becomes the contrapoint
+            x_blk = x_pre
+            f_blk = f_pre
+            s_pre = s_cur = x_cur - x_pre
+        if abs(f_blk) < abs(f_cur):
+            # Keep x_cur as the best estimate
+            x_pre = x_cur
+            x_cur = x_blk
+            x_blk = x_pre
+            f_pre = f_cur
+            f_cur = f_blk
+            f_blk = f_pre
+
+        delta = 0.5 * (_BRENT_XTOL + _BRENT_RTOL * abs(x_cur))
+        s_bis = 0.5 * (x_blk - x_cur)
+        if abs(f_cur) < tol or abs(s_bis) < delta:
+            return x_cur
+
+        if abs(s_pre) > delta and abs(f_cur) < abs(f_pre):
+            if x_pre == x_blk:
+                # Secant
+                s_try = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+            else:
+                # Inverse quadratic interpolation
+                d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+                d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                s_try = -f_cur * (f_blk * d_blk - f_pre * d_pre) / (d_blk * d_pre * (f_blk - f_pre))
+            if 2.0 * abs(s_try) < min(abs(s_pre), 3.0 * abs(s_bis) - delta):
+                s_pre = s_cur
+                s_cur = s_try
+            else:
+                s_pre = s_cur = s_bis
+        else:
+            s_pre = s_cur = s_bis
+
+        x_pre = x_cur
+        f_pre = f_cur
+        if abs(s_cur) > delta:
+            x_cur += s_cur
+        else:
+            x_cur += delta if s_bis > 0.0 else -delta
+        f_cur = _bs_price_from_sigma(x_cur, log_sk, r, q, tau, sqrt_tau, df_r, df_q, S, K, theta) - market_price
+
+    return x_cur
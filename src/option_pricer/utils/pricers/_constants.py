@@ -0,0 +1,17 @@
+# pricers/_constants.py
+"""
+Numerical constants shared by the NumPy, pure-Python and numba pricing paths.
+
+Kept free of numba (and of any other optional import) so every pricer module
+can read the same values whichever solver path is active.
+"""
+
+from math import pi, sqrt
+
+_INV_SQRT2 = 1.0 / sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * pi)
+
+# Newton gives up (NaN -> caller falls back to a bracketed solve) once vega < _VEGA_FLOOR * max(1, S)
+# or |d1| > _D1_MAX: there the step diff / vega is dominated by rounding in diff
+_VEGA_FLOOR = 1e-6
+_D1_MAX = 8.0
@@ -0,0 +1,102 @@
+# pricers/_iv_numba.py
+"""
+Numba kernels for batch implied volatility.
+
+Functions:
+- iv_newton_array_kernel(prices, S, K, r, q, tau, is_call, out_sigma, max_iter, tol)  (all per element)
+- iv_greeks_kernel(prices, S, K, r, q, tau, is_call, out_sigma, out_delta, out_gamma,
+                   out_theta, out_rho, max_iter, tol)  (IV + Greeks fused; single S, r, q)
+
+Each strike's Newton iteration is `_bs_numba.iv_newton_scalar` (the one compiled
+Newton loop, self-seeded with Corrado-Miller) called on scalars inside a parallel
+`prange` loop, so no temporary arrays are allocated per iteration.
+Importing this module requires numba; callers should guard the import.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from src.option_pricer.utils.pricers._bs_numba import _FASTMATH, _norm_cdf, iv_newton_scalar
+from src.option_pricer.utils.pricers._constants import _INV_SQRT_2PI
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def iv_newton_array_kernel(prices, S, K, r, q, tau, is_call, out_sigma, max_iter, tol):
+    """
+    Newton-Raphson IV per element (S, K, r, q and tau all per-element arrays), written into `out_sigma`.
+
+    Elements that do not converge, hit vega ~ 0 or have invalid inputs are left as NaN.
+    """
+    n = K.shape[0]
+
+    for i in prange(n):
+        out_sigma[i] = np.nan
+        price = prices[i]
+        s = S[i]
+        k = K[i]
+        t = tau[i]
+        if price > 0.0 and k > 0.0 and t > 0.0 and s > 0.0:
+            out_sigma[i] = iv_newton_scalar(price, s, k, r[i], q[i], t, is_call[i], math.nan, tol, max_iter)
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def iv_greeks_kernel(
+    prices, S, K, r, q, tau, is_call,
+    out_sigma, out_delta, out_gamma, out_theta, out_rho,
+    max_iter, tol,
+):
+    """
+    IV (single S, r, q; `tau` per element) plus delta, gamma, theta and rho at that IV, per element, in one
+    parallel pass: each contract's Newton loop and Greeks run on scalars in the same `prange` body.
+
+    Greeks follow `bsm_all_greeks` (theta per year, rho per 1.0 in r). Elements whose IV is NaN
+    get NaN Greeks, so callers can fall back row-wise.
+    """
+    n = K.shape[0]
+
+    for i in prange(n):
+        out_sigma[i] = np.nan
+        out_delta[i] = np.nan
+        out_gamma[i] = np.nan
+        out_theta[i] = np.nan
+        out_rho[i] = np.nan
+        price = prices[i]
+        k = K[i]
+        t = tau[i]
+        if not (price > 0.0 and k > 0.0 and t > 0.0 and S > 0.0):
+            continue
+        sign = 1.0 if is_call[i] else -1.0
+        sigma = iv_newton_scalar(price, S, k, r, q, t, is_call[i], math.nan, tol, max_iter)
+        if math.isnan(sigma):
+            continue
+
+        sqrt_tau = math.sqrt(t)
+        d1 = (math.log(S / k) + (r - q + 0.5 * sigma * sigma) * t) / (sigma * sqrt_tau)
+        d2 = d1 - sigma * sqrt_tau
+        disc_q = math.exp(-q * t)
+        s_disc = S * disc_q
+        k_disc = k * math.exp(-r * t)
+        pdf_d1 = math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        n_d1 = _norm_cdf(sign * d1)      # N(d1) for calls, N(-d1) for puts
+        n_d2 = _norm_cdf(sign * d2)
+
+        out_sigma[i] = sigma
+        out_delta[i] = sign * disc_q * n_d1
+        out_gamma[i] = disc_q * pdf_d1 / (S * sigma * sqrt_tau)
+        out_theta[i] = -(s_disc * pdf_d1 * sigma) / (2.0 * sqrt_tau) + sign * (q * s_disc * n_d1 - r * k_disc * n_d2)
+        out_rho[i] = sign * k_disc * t * n_d2
+
+
+# Warm up the JIT (or load it from the on-disk cache) at import time
+iv_newton_array_kernel(
+    np.array([10.45]), np.array([100.0]), np.array([100.0]), np.array([0.05]), np.array([0.0]),
+    np.array([1.0]), np.array([True]), np.empty(1), 20, 1e-6,
+)
+iv_greeks_kernel(
+    np.array([10.45]), 100.0, np.array([100.0]), 0.05, 0.0, np.array([1.0]), np.array([True]),
+    np.empty(1), np.empty(1), np.empty(1), np.empty(1), np.empty(1), 20, 1e-6,
+)
@@ -9,19 +9,56 @@ Functions:
 - bsm_gamma(...)
 - bsm_theta(...)
 - bsm_rho(...)
+
+Vectorized counterparts (NumPy arrays in, arrays out; `is_call` is a bool mask):
+- black_scholes_price_vec, bsm_vega_vec, bsm_delta_vec, bsm_gamma_vec,
+  bsm_theta_vec, bsm_rho_vec
+- bsm_all_greeks(...) -> dict of price and every Greek from one d1/d2 pass
 """
 
 from __future__ import annotations
 
-from math import log, sqrt, exp
-from typing import Literal, Tuple
+from math import log, sqrt, exp, erfc
+from typing import Dict, Literal, Optional, Tuple
+
+import numpy as np
+from scipy.special import ndtr
+
+try:  # numba is optional: compiled scalar kernel for the non-degenerate case
+    from src.option_pricer.utils.pricers._bs_numba import bs_price as _bs_price_nb
+except ImportError:
+    _bs_price_nb = None
 
-from scipy.stats import norm
+from src.option_pricer.utils.pricers._constants import _INV_SQRT2, _INV_SQRT_2PI
 
 OptionType = Literal["C", "P"]
 
 
-def _d1_d2(S: float, K: float, r: float, q: float, sigma: float, tau: float) -> Tuple[float, float]:
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF for Python floats via math.erfc (no ufunc dispatch; ndtr is for arrays)."""
+    return 0.5 * erfc(-x * _INV_SQRT2)
+
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal density (inline; avoids scipy.stats dispatch)."""
+    return exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+def _d1_d2_precomp(
+    log_sk: float, sqrt_tau: float, r: float, q: float, sigma: float, tau: float
+) -> Tuple[float, float]:
+    """
+    d1, d2 from precomputed log(S/K) and sqrt(tau), for callers that reuse them
+    across several sigmas or Greeks. No degenerate-input guard (see `_d1_d2`).
+    """
+    sigma_sqrt_t = sigma * sqrt_tau
+    d1 = (log_sk + (r - q + 0.5 * sigma * sigma) * tau) / sigma_sqrt_t
+    return d1, d1 - sigma_sqrt_t
+
+
+def _d1_d2(
+    S: float, K: float, r: float, q: float, sigma: float, tau: float, sqrt_tau: Optional[float] = None
+) -> Tuple[float, float]:
     """
     Compute d1 and d2 used in Black-Scholes formula.
 
@@ -30,15 +67,13 @@ def _d1_d2(S: float, K: float, r: float, q: float, sigma: float, tau: float) ->
     Notes:
     - If tau <= 0 or sigma <= 0 we return values that will be handled
       by callers (they typically handle tau<=0 / sigma<=0 as special cases).
+    - Pass `sqrt_tau` when the caller needs it anyway, so it is computed once.
     """
     if tau <= 0 or sigma <= 0 or S <= 0 or K <= 0:
-        # Return huge values that make norm.cdf(d) approach 1 or 0 as needed.
+        # Return huge values that make _norm_cdf(d) approach 1 or 0 as needed.
         # Callers handle tau<=0 separately, but this avoids division by zero.
         return float("inf"), float("inf")
-    sqrt_t = sqrt(tau)
-    d1 = (log(S / K) + (r - q + 0.5 * sigma**2) * tau) / (sigma * sqrt_t)
-    d2 = d1 - sigma * sqrt_t
-    return d1, d2
+    return _d1_d2_precomp(log(S / K), sqrt(tau) if sqrt_tau is None else sqrt_tau, r, q, sigma, tau)
 
 
 def black_scholes_price(
@@ -75,21 +110,29 @@ def black_scholes_price(
     float
         Model price (same units as S/K).
     """
+    return _black_scholes_price_flag(S, K, r, q, sigma, tau, option_type == "C")
+
+
+def _black_scholes_price_flag(
+    S: float, K: float, r: float, q: float, sigma: float, tau: float, is_call: bool
+) -> float:
+    """
+    `black_scholes_price` with a bool call flag, for solvers that normalized the option
+    type once and thread the flag through (no string compares per evaluation).
+    """
+    # Jäckel's θ = +1 (call) / -1 (put): one expression for both, no branch
+    theta = 1.0 if is_call else -1.0
+
     # Immediate expiry: option value is intrinsic
     if tau <= 0:
-        if option_type == "C":
-            return max(S - K, 0.0)
-        else:
-            return max(K - S, 0.0)
+        return max(theta * (S - K), 0.0)
 
     # Zero sigma (volatility): return forward price minus discounted strike
     if sigma <= 0:
-        df_r = exp(-r * tau)
-        df_q = exp(-q * tau)
-        if option_type == "C":
-            return max(S * df_q - K * df_r, 0.0)
-        else:
-            return max(K * df_r - S * df_q, 0.0)
+        return max(theta * (S * exp(-q * tau) - K * exp(-r * tau)), 0.0)
+
+    if _bs_price_nb is not None and S > 0 and K > 0:
+        return float(_bs_price_nb(S, K, r, q, sigma, tau, is_call))
 
     d1, d2 = _d1_d2(S, K, r, q, sigma, tau)
     # risk free discount factor
@@ -97,10 +140,7 @@ def black_scholes_price(
     # dividend discount factor
     df_q = exp(-q * tau)
 
-    if option_type == "C":
-        price = S * df_q * norm.cdf(d1) - K * df_r * norm.cdf(d2)
-    else:
-        price = K * df_r * norm.cdf(-d2) - S * df_q * norm.cdf(-d1)
+    price = theta * (S * df_q * _norm_cdf(theta * d1) - K * df_r * _norm_cdf(theta * d2))
 
     return float(price)
 
@@ -111,8 +151,9 @@ def bsm_vega(S: float, K: float, r: float, q: float, sigma: float, tau: float) -
     """
     if tau <= 0 or sigma <= 0:
         return 0.0
-    d1, _ = _d1_d2(S, K, r, q, sigma, tau)
-    return float(S * exp(-q * tau) * sqrt(tau) * norm.pdf(d1))
+    sqrt_t = sqrt(tau)
+    d1, _ = _d1_d2(S, K, r, q, sigma, tau, sqrt_t)
+    return float(S * exp(-q * tau) * sqrt_t * _norm_pdf(d1))
 
 
 def bsm_delta(S: float, K: float, r: float, q: float, sigma: float, tau: float, option_type: OptionType) -> float:
@@ -128,9 +169,9 @@ def bsm_delta(S: float, K: float, r: float, q: float, sigma: float, tau: float,
 
     d1, _ = _d1_d2(S, K, r, q, sigma, tau)
     if option_type == "C":
-        return float(exp(-q * tau) * norm.cdf(d1))
+        return float(exp(-q * tau) * _norm_cdf(d1))
     else:
-        return float(exp(-q * tau) * (norm.cdf(d1) - 1.0))
+        return float(exp(-q * tau) * (_norm_cdf(d1) - 1.0))
 
 
 def bsm_gamma(S: float, K: float, r: float, q: float, sigma: float, tau: float) -> float:
@@ -139,8 +180,9 @@ def bsm_gamma(S: float, K: float, r: float, q: float, sigma: float, tau: float)
     """
     if tau <= 0 or sigma <= 0:
         return 0.0
-    d1, _ = _d1_d2(S, K, r, q, sigma, tau)
-    return float(exp(-q * tau) * norm.pdf(d1) / (S * sigma * sqrt(tau)))
+    sqrt_t = sqrt(tau)
+    d1, _ = _d1_d2(S, K, r, q, sigma, tau, sqrt_t)
+    return float(exp(-q * tau) * _norm_pdf(d1) / (S * sigma * sqrt_t))
 
 
 def bsm_theta(
@@ -154,18 +196,19 @@ def bsm_theta(
     if tau <= 0:
         return 0.0
 
-    d1, d2 = _d1_d2(S, K, r, q, sigma, tau)
+    sqrt_t = sqrt(tau)
+    d1, d2 = _d1_d2(S, K, r, q, sigma, tau, sqrt_t)
     df_r = exp(-r * tau)
     df_q = exp(-q * tau)
 
-    term1 = - (S * df_q * norm.pdf(d1) * sigma) / (2 * sqrt(tau))
+    term1 = - (S * df_q * _norm_pdf(d1) * sigma) / (2 * sqrt_t)
     if option_type == "C":
-        term2 = q * S * df_q * norm.cdf(d1)
-        term3 = - r * K * df_r * norm.cdf(d2)
+        term2 = q * S * df_q * _norm_cdf(d1)
+        term3 = - r * K * df_r * _norm_cdf(d2)
         theta = term1 + term2 + term3
     else:
-        term2 = - q * S * df_q * norm.cdf(-d1)
-        term3 = r * K * df_r * norm.cdf(-d2)
+        term2 = - q * S * df_q * _norm_cdf(-d1)
+        term3 = r * K * df_r * _norm_cdf(-d2)
         theta = term1 + term2 + term3
 
     return float(theta)
@@ -182,6 +225,151 @@ def bsm_rho(S: float, K: float, r: float, q: float, sigma: float, tau: float, op
     df_r = exp(-r * tau)
 
     if option_type == "C":
-        return float(K * tau * df_r * norm.cdf(d2))
+        return float(K * tau * df_r * _norm_cdf(d2))
     else:
-        return float(-K * tau * df_r * norm.cdf(-d2))
+        return float(-K * tau * df_r * _norm_cdf(-d2))
+
+
+# -------------------------------------------------
+# Vectorized versions
+# -------------------------------------------------
+# Same conventions and degenerate-input handling as the scalar functions above,
+# evaluated with NumPy ufuncs over whole arrays (broadcast against each other).
+
+
+def _d1_d2_vec(S, K, r, q, sigma, tau):
+    """
+    Array version of `_d1_d2`: returns (d1, d2, sqrt_tau), with d1 = d2 = +inf
+    wherever tau, sigma, S or K is non-positive (as the scalar version does) and
+    NaN where sigma is NaN (an unsolved IV), so prices and Greeks come out NaN
+    there too, as in the scalar functions; sqrt_tau is 1.0 at those positions.
+    """
+    ok = (tau > 0) & (sigma > 0) & (S > 0) & (K > 0)
+    # Evaluate on harmless placeholders where inputs are degenerate, then overwrite
+    S_safe, K_safe = np.where(ok, S, 1.0), np.where(ok, K, 1.0)
+    sigma_safe, tau_safe = np.where(ok, sigma, 1.0), np.where(ok, tau, 1.0)
+    sqrt_t = np.sqrt(tau_safe)
+    d1 = (np.log(S_safe / K_safe) + (r - q + 0.5 * sigma_safe**2) * tau_safe) / (sigma_safe * sqrt_t)
+    d2 = d1 - sigma_safe * sqrt_t
+    fill = np.where(np.isnan(sigma), np.nan, np.inf)
+    return np.where(ok, d1, fill), np.where(ok, d2, fill), sqrt_t
+
+
+def _as_arrays(S, K, r, q, sigma, tau):
+    return tuple(np.asarray(x, dtype=float) for x in (S, K, r, q, sigma, tau))
+
+
+def black_scholes_price_vec(S, K, r, q, sigma, tau, is_call) -> np.ndarray:
+    """
+    Black-Scholes (European) prices for arrays of inputs; see `black_scholes_price`.
+    """
+    S, K, r, q, sigma, tau = _as_arrays(S, K, r, q, sigma, tau)
+    theta = np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+
+    d1, d2, _ = _d1_d2_vec(S, K, r, q, sigma, tau)
+    df_r = np.exp(-r * tau)
+    df_q = np.exp(-q * tau)
+    price = theta * (S * df_q * ndtr(theta * d1) - K * df_r * ndtr(theta * d2))
+
+    # Immediate expiry -> intrinsic; zero sigma -> discounted forward intrinsic
+    intrinsic = np.maximum(theta * (S - K), 0.0)
+    forward_intrinsic = np.maximum(theta * (S * df_q - K * df_r), 0.0)
+    price = np.where(sigma <= 0, forward_intrinsic, price)
+    return np.where(tau <= 0, intrinsic, price)
+
+
+def bsm_vega_vec(S, K, r, q, sigma, tau) -> np.ndarray:
+    """Vega for arrays of inputs (per 1.0 change in sigma); see `bsm_vega`."""
+    S, K, r, q, sigma, tau = _as_arrays(S, K, r, q, sigma, tau)
+    d1, _, sqrt_t = _d1_d2_vec(S, K, r, q, sigma, tau)
+    vega = S * np.exp(-q * tau) * sqrt_t * np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    return np.where((tau <= 0) | (sigma <= 0), 0.0, vega)
+
+
+def bsm_delta_vec(S, K, r, q, sigma, tau, is_call) -> np.ndarray:
+    """Delta for arrays of inputs; see `bsm_delta`."""
+    S, K, r, q, sigma, tau = _as_arrays(S, K, r, q, sigma, tau)
+    is_call = np.asarray(is_call, dtype=bool)
+    d1, _, _ = _d1_d2_vec(S, K, r, q, sigma, tau)
+    delta = np.exp(-q * tau) * (ndtr(d1) - np.where(is_call, 0.0, 1.0))
+
+    payoff_delta = np.where(is_call, np.where(S > K, 1.0, 0.0), np.where(S < K, -1.0, 0.0))
+    return np.where(tau <= 0, payoff_delta, delta)
+
+
+def bsm_gamma_vec(S, K, r, q, sigma, tau) -> np.ndarray:
+    """Gamma for arrays of inputs; see `bsm_gamma`."""
+    S, K, r, q, sigma, tau = _as_arrays(S, K, r, q, sigma, tau)
+    d1, _, sqrt_t = _d1_d2_vec(S, K, r, q, sigma, tau)
+    degenerate = (tau <= 0) | (sigma <= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = np.exp(-q * tau) * np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI / (S * np.where(degenerate, 1.0, sigma) * sqrt_t)
+    return np.where(degenerate, 0.0, gamma)
+
+
+def bsm_theta_vec(S, K, r, q, sigma, tau, is_call) -> np.ndarray:
+    """Theta (annualized) for arrays of inputs; see `bsm_theta`."""
+    S, K, r, q, sigma, tau = _as_arrays(S, K, r, q, sigma, tau)
+    theta_sign = np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+    d1, d2, sqrt_t = _d1_d2_vec(S, K, r, q, sigma, tau)
+    df_r = np.exp(-r * tau)
+    df_q = np.exp(-q * tau)
+
+    term1 = -(S * df_q * np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI * sigma) / (2 * sqrt_t)
+    term23 = theta_sign * (q * S * df_q * ndtr(theta_sign * d1) - r * K * df_r * ndtr(theta_sign * d2))
+    return np.where(tau <= 0, 0.0, term1 + term23)
+
+
+def bsm_rho_vec(S, K, r, q, sigma, tau, is_call) -> np.ndarray:
+    """Rho for arrays of inputs; see `bsm_rho`."""
+    S, K, r, q, sigma, tau = _as_arrays(S, K, r, q, sigma, tau)
+    theta_sign = np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+    _, d2, _ = _d1_d2_vec(S, K, r, q, sigma, tau)
+    rho = theta_sign * K * tau * np.exp(-r * tau) * ndtr(theta_sign * d2)
+    return np.where(tau <= 0, 0.0, rho)
+
+
+def bsm_all_greeks(S, K, r, q, sigma, tau, is_call) -> Dict[str, np.ndarray]:
+    """
+    Price, delta, gamma, theta, rho and vega for arrays of inputs in one pass.
+
+    d1/d2, the discount factors, N(±d1), N(±d2) and φ(d1) are evaluated once and
+    shared, instead of once per Greek. Values match the individual `*_vec` functions.
+    """
+    S, K, r, q, sigma, tau = _as_arrays(S, K, r, q, sigma, tau)
+    is_call = np.asarray(is_call, dtype=bool)
+    theta_sign = np.where(is_call, 1.0, -1.0)
+
+    d1, d2, sqrt_t = _d1_d2_vec(S, K, r, q, sigma, tau)
+    df_r = np.exp(-r * tau)
+    df_q = np.exp(-q * tau)
+    pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    n_d1 = ndtr(theta_sign * d1)      # N(d1) for calls, N(-d1) for puts
+    n_d2 = ndtr(theta_sign * d2)
+    s_disc = S * df_q
+    k_disc = K * df_r
+
+    expired = tau <= 0
+    degenerate = expired | (sigma <= 0)
+
+    price = theta_sign * (s_disc * n_d1 - k_disc * n_d2)
+    price = np.where(sigma <= 0, np.maximum(theta_sign * (s_disc - k_disc), 0.0), price)
+    price = np.where(expired, np.maximum(theta_sign * (S - K), 0.0), price)
+
+    delta = theta_sign * df_q * n_d1
+    payoff_delta = np.where(is_call, np.where(S > K, 1.0, 0.0), np.where(S < K, -1.0, 0.0))
+    delta = np.where(expired, payoff_delta, delta)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = df_q * pdf_d1 / (S * np.where(degenerate, 1.0, sigma) * sqrt_t)
+    gamma = np.where(degenerate, 0.0, gamma)
+
+    theta = -(s_disc * pdf_d1 * sigma) / (2 * sqrt_t) + theta_sign * (q * s_disc * n_d1 - r * k_disc * n_d2)
+    theta = np.where(expired, 0.0, theta)
+
+    rho = theta_sign * K * tau * df_r * n_d2
+    rho = np.where(expired, 0.0, rho)
+
+    vega = np.where(degenerate, 0.0, s_disc * sqrt_t * pdf_d1)
+
+    return {"price": price, "delta": delta, "gamma": gamma, "theta": theta, "rho": rho, "vega": vega}
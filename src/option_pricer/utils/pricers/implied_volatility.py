@@ -1,33 +1,155 @@
 # pricers/implied_volatility.py
 from __future__ import annotations
-from typing import Optional
-from math import isfinite
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, Union
+from math import isfinite, isnan, nan, sqrt, exp, log, erfc, pi
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+logger = logging.getLogger(__name__)
+
+try:  # optional: Jäckel's reference "Let's Be Rational" implementation (not in requirements.txt)
+    from py_lets_be_rational import implied_volatility_from_a_transformed_rational_guess as _lbr_implied_vol
+except ImportError as exc:
+    _lbr_implied_vol = None
+    if getattr(exc, "name", None) == "py_lets_be_rational":
+        logger.debug("py_lets_be_rational not installed; using the built-in normalized Black solver")
+    else:  # installed but broken (e.g. its missing `cody_special` module): say so instead of hiding it
+        logger.warning("py_lets_be_rational failed to import (%s); using the built-in normalized Black solver", exc)
+
+try:  # numba is optional: compiled scalar Newton / Householder / Brent kernels
+    from src.option_pricer.utils.pricers._bs_numba import (
+        corrado_miller_guess as _corrado_miller_nb,
+        iv_brent_scalar as _iv_brent_nb,
+        iv_householder_scalar as _iv_householder_nb,
+        iv_newton_scalar as _iv_newton_scalar_nb,
+        price_bounds as _price_bounds_nb,
+    )
+    from src.option_pricer.utils.pricers._iv_numba import iv_newton_array_kernel as _iv_newton_array_nb
+except ImportError:
+    _corrado_miller_nb = _iv_brent_nb = _iv_householder_nb = _iv_newton_scalar_nb = _iv_newton_array_nb = None
+    _price_bounds_nb = None
+
+from src.option_pricer.utils.pricers._constants import _D1_MAX, _INV_SQRT2, _INV_SQRT_2PI, _VEGA_FLOOR
+from src.option_pricer.utils.pricers.black_scholes import _black_scholes_price_flag
+
+# Per-iteration tracing for the scalar Newton / bracketed loops. Off in production: when
+# set, those loops also skip the compiled kernels, so every step is printed.
+_DEBUG_IV = False
+
+
+# Option type as accepted by the scalar solvers: "C"/"P" (any case, or "call"/"put"), or the
+# bool call flag `implied_volatility` normalizes it to once and threads through
+OptionFlag = Union[str, bool]
+
 
-from src.option_pricer.utils.pricers.black_scholes import (
-    black_scholes_price,
-    bsm_vega,
-)
+def _is_call(option_type: OptionFlag) -> bool:
+    """Call flag from an `OptionFlag`; bools pass straight through (no string work)."""
+    if isinstance(option_type, (bool, np.bool_)):
+        return bool(option_type)
+    return option_type[:1] in ("C", "c")
 
 
-def _price_bounds(S: float, K: float, r: float, q: float, tau: float, option_type: str):
+# Slack on the arbitrage bounds, so quotes sitting exactly on a bound survive float noise
+_PRICE_BOUND_EPS = 1e-12
+
+
+def _price_bounds_py(S: float, K: float, r: float, q: float, tau: float, is_call: bool) -> Tuple[float, float]:
     """
     Returns (lower_bound, upper_bound) arbitrage bounds for option prices under continuous rates:
       Call:  lower = max(0, S*e^{-q T} - K*e^{-r T}), upper = S*e^{-q T}
       Put :  lower = max(0, K*e^{-r T} - S*e^{-q T}), upper = K*e^{-r T}
+    Numba-free body of `_price_bounds_flag` (same formulas as `_bs_numba.price_bounds`).
     """
-    from math import exp
-
     df_r = exp(-r * tau)
     df_q = exp(-q * tau)
-    if option_type.upper().startswith("C"):
-        lower = max(0.0, S * df_q - K * df_r)
-        upper = S * df_q
-    else:
-        lower = max(0.0, K * df_r - S * df_q)
-        upper = K * df_r
+    if is_call:
+        return max(0.0, S * df_q - K * df_r), S * df_q
+    return max(0.0, K * df_r - S * df_q), K * df_r
+
+
+# Scalar bounds with a bool call flag: the compiled kernel when numba is installed (it also
+# takes the NumPy scalars batch loops index out, unboxed), else the Python body above
+_price_bounds_flag = _price_bounds_nb if _price_bounds_nb is not None else _price_bounds_py
+
+
+def _price_bounds_vec(S, K, r, q, tau, is_call) -> Tuple[np.ndarray, np.ndarray]:
+    """`_price_bounds_flag` for arrays (broadcast together, bool call mask): (lower, upper) arrays."""
+    s_disc = S * np.exp(-q * tau)
+    k_disc = K * np.exp(-r * tau)
+    lower = np.maximum(0.0, np.where(is_call, s_disc - k_disc, k_disc - s_disc))
+    upper = np.where(is_call, s_disc, k_disc)
     return lower, upper
 
 
+# Clip range for the Manaster-Koehler starting point
+_MK_SIGMA_MIN = 0.05
+_MK_SIGMA_MAX = 2.0
+
+
+def _manaster_koehler_guess(S: float, K: float, r: float, q: float, tau: float) -> float:
+    """
+    Manaster-Koehler (1982) Newton starting point sqrt(2|ln(S/K) + (r-q)tau| / tau),
+    clipped to [0.05, 2.0]. Far better than a flat 0.2 away from the money.
+    """
+    guess = sqrt(abs(2.0 * (log(S / K) + (r - q) * tau)) / max(tau, 1e-8))
+    return min(max(guess, _MK_SIGMA_MIN), _MK_SIGMA_MAX)
+
+
+def _corrado_miller_guess(
+    price: float, S: float, K: float, r: float, q: float, tau: float, option_type: OptionFlag
+) -> float:
+    """
+    Corrado-Miller (1996) closed-form IV approximation as a Newton starting point:
+      sigma ~ sqrt(2 pi / tau) / (S' + K') * (h + sqrt(max(h^2 - (S' - K')^2 / pi, 0)))
+    with S' = S e^{-q tau}, K' = K e^{-r tau}, h = C - (S' - K') / 2 (puts via parity).
+    Usually within a Halley step or two of the root; Manaster-Koehler where it is not positive.
+    Compiled as `_bs_numba.corrado_miller_guess` (which the numba kernels seed with) when numba
+    is installed; the body below is the numba-free fallback.
+    """
+    s_disc = S * exp(-q * tau)
+    k_disc = K * exp(-r * tau)
+    if _corrado_miller_nb is not None:
+        return _corrado_miller_nb(
+            float(price), s_disc, k_disc, log(S / K) + (r - q) * tau, float(tau), _is_call(option_type),
+        )
+    call = price if _is_call(option_type) else price + s_disc - k_disc
+    h = call - 0.5 * (s_disc - k_disc)
+    disc = h * h - (s_disc - k_disc) ** 2 / pi
+    guess = sqrt(2.0 * pi / tau) / (s_disc + k_disc) * (h + sqrt(max(disc, 0.0)))
+    if not (guess > 0.0 and isfinite(guess)):
+        return _manaster_koehler_guess(S, K, r, q, tau)
+    return guess
+
+
+def _bsm_price_from_sigma(
+    sigma: float, log_sk: float, r: float, q: float, tau: float,
+    sqrt_tau: float, df_r: float, df_q: float, S: float, K: float, theta: float,
+) -> float:
+    """
+    Black-Scholes price from precomputed log(S/K), sqrt(tau) and discount factors, so a
+    root-finder only pays for d1, d2 and the two N(.) per evaluation; theta = +1 call / -1 put.
+    """
+    d1 = (log_sk + (r - q + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
+    d2 = d1 - sigma * sqrt_tau
+    return theta * 0.5 * (S * df_q * erfc(-theta * d1 * _INV_SQRT2) - K * df_r * erfc(-theta * d2 * _INV_SQRT2))
+
+
+def _halley_step(diff: float, vega: float, d1d2: float, sigma: float) -> float:
+    """
+    Newton step diff / vega with Halley's correction from vomma = vega * d1 * d2 / sigma
+    (cubic convergence); plain Newton where the correction factor is >= 1.
+    """
+    step = diff / vega
+    adj = 0.5 * step * d1d2 / sigma
+    if abs(adj) < 1.0:
+        step /= 1.0 - adj
+    return step
+
+
 def implied_vol_newton(
     market_price: float,
     S: float,
@@ -35,82 +157,420 @@ def implied_vol_newton(
     r: float,
     q: float,
     tau: float,
-    option_type: str,
-    initial_vol: float = 0.2,
+    option_type: OptionFlag,
+    initial_vol: Optional[float] = None,
     tol: float = 1e-6,
-    max_iter: int = 20,
+    max_iter: int = 16,
 ) -> float:
-
-    sigma = initial_vol
-
-    print("\n--- NEWTON START ---")
-    print(f"S={S}, K={K}, tau={tau}, market={market_price}, type={option_type}")
-
+    """
+    Newton-Raphson IV (Halley-corrected steps) for one contract; NaN if it fails (callers fall back to `implied_vol_bracketed`).
+    With numba installed the solve runs compiled via `implied_vol_newton_fast` (a fixed three-step
+    Householder(3) solve, Newton on a miss); otherwise the Python loop below, which prints
+    every step when `_DEBUG_IV` is set.
+    """
+    if _iv_newton_scalar_nb is not None and not _DEBUG_IV and tau > 0 and S > 0 and K > 0:
+        return implied_vol_newton_fast(market_price, S, K, r, q, tau, option_type, initial_vol, tol, max_iter)
+
+    if _DEBUG_IV:
+        print("\n--- NEWTON START ---")
+        print(f"S={S}, K={K}, tau={tau}, market={market_price}, type={option_type}")
+
+    if tau <= 0 or S <= 0 or K <= 0:
+        if _DEBUG_IV:
+            print("STOP: degenerate inputs → fallback to bracketed solve")
+        return nan
+
+    sigma = initial_vol if initial_vol is not None else _corrado_miller_guess(market_price, S, K, r, q, tau, option_type)
+
+    # Everything that does not depend on sigma is bound once, outside the loop
+    theta = 1.0 if _is_call(option_type) else -1.0
+    sqrt_tau = sqrt(tau)
+    s_disc = S * exp(-q * tau)
+    k_disc = K * exp(-r * tau)
+    log_sk = log(S / K)
+    drift = (r - q) * tau
+
+    def _bs_price_vega_scalar(sigma: float) -> Tuple[float, float, float, float]:
+        sig_sqrt_tau = sigma * sqrt_tau
+        d1 = (log_sk + drift) / sig_sqrt_tau + 0.5 * sig_sqrt_tau
+        d2 = d1 - sig_sqrt_tau
+        price = theta * 0.5 * (s_disc * erfc(-theta * d1 * _INV_SQRT2) - k_disc * erfc(-theta * d2 * _INV_SQRT2))
+        vega = s_disc * sqrt_tau * exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        return price, vega, d1, d2
+
+    vega_floor = _VEGA_FLOOR * max(1.0, S)
     for i in range(max_iter):
 
-        model_price = black_scholes_price(S, K, r, q, sigma, tau, option_type)
+        model_price, v, d1, d2 = _bs_price_vega_scalar(sigma)
         diff = model_price - market_price
-        v = bsm_vega(S, K, r, q, sigma, tau)
 
-        print(
-            f"Iter {i} | sigma={sigma:.6f} | model={model_price:.6f} | "
-            f"market={market_price:.6f} | diff={diff:.6f} | vega={v:.6f}"
-        )
+        if _DEBUG_IV:
+            print(
+                f"Iter {i} | sigma={sigma:.6f} | model={model_price:.6f} | "
+                f"market={market_price:.6f} | diff={diff:.6f} | vega={v:.6f}"
+            )
 
         # Convergence reached
         if abs(diff) < tol:
-            print(f"NEWTON SUCCESS → sigma={sigma:.6f}")
+            if _DEBUG_IV:
+                print(f"NEWTON SUCCESS → sigma={sigma:.6f}")
             return sigma
 
-        # Stop if vega too small
-        if v < 1e-8:
-            print("STOP: Vega too small → fallback to bisection")
-            return None
-
-        # Newton step
-        sigma = sigma - diff / v
+        # Stop if vega too small (or d1 in the tails)
+        if v < vega_floor or abs(d1) > _D1_MAX:
+            if _DEBUG_IV:
+                print("STOP: Vega too small → fallback to bracketed solve")
+            return nan
+
+        # Halley step (vomma = vega * d1 * d2 / sigma); stop once it is small relative to sigma (Jäckel eq. 16)
+        step = _halley_step(diff, v, d1 * d2, sigma)
+        converged = abs(step) < tol * max(abs(sigma), 1e-8)
+        sigma = sigma - step
+        if converged and sigma > 0:
+            if _DEBUG_IV:
+                print(f"NEWTON SUCCESS (step) → sigma={sigma:.6f}")
+            return sigma
 
         # Don't allow negative sigma
         if sigma <= 0:
-            print("Sigma went negative, resetting to 1e-6")
+            if _DEBUG_IV:
+                print("Sigma went negative, resetting to 1e-6")
             sigma = 1e-6
 
-    print("NEWTON FAILED → Fallback to bisection")
-    return None
+    if _DEBUG_IV:
+        print("NEWTON FAILED → Fallback to bracketed solve")
+    return nan
 
 
+# Inputs are rounded to this many decimals to form the cache key, so float noise from
+# re-processing the same chain still maps to the same entry. Only the key is rounded:
+# a miss is solved on the caller's exact inputs (rounding r / q to 1e-6 alone can move
+# the price by ~1e-4 on long-dated contracts).
+_IV_CACHE_DECIMALS = 6
 
-def implied_vol_bisection(
-    market_price, S, K, r, q, tau, option_type,
-    low=1e-6, high=5.0, tol=1e-6, max_iter=100
-):
 
-    print("\n--- BISECTION START ---")
-    print(f"S={S}, K={K}, tau={tau}, market={market_price}, type={option_type}")
+class _RoundedLRU:
+    """
+    LRU memo keyed on a caller-built (rounded) tuple; a miss runs `solve()`, which
+    closes over the unrounded inputs. Thread-safe like `functools.lru_cache`, with
+    the solve itself outside the lock.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[tuple, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_solve(self, key: tuple, solve: Callable[[], float]) -> float:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+        value = solve()
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _iv_cache_key(price: float, S: float, K: float, r: float, q: float, tau: float, *rest) -> tuple:
+    d = _IV_CACHE_DECIMALS
+    return (round(price, d), round(K, d), round(tau, d), round(S, d), round(r, d), round(q, d)) + rest
 
-    for i in range(max_iter):
-        mid = (low + high) / 2
-        price = black_scholes_price(S, K, r, q, mid, tau, option_type)
 
-        print(
-            f"Iter {i} | mid={mid:.6f} | price={price:.6f} | "
-            f"low={low:.6f} | high={high:.6f}"
+_IV_NEWTON_MEMO = _RoundedLRU(maxsize=8192)
+
+
+def implied_vol_cached(
+    market_price: float,
+    S: float,
+    K: float,
+    r: float,
+    q: float,
+    tau: float,
+    option_type: OptionFlag,
+    initial_vol: Optional[float] = None,
+    tol: float = 1e-6,
+    max_iter: int = 16,
+) -> float:
+    """
+    Memoized `implied_vol_newton` (LRU, 8192 entries) keyed on inputs rounded to
+    1e-6, so re-solving an unchanged chain within a session is a dict lookup.
+    Misses are solved on the exact inputs; failures are cached as NaN, like the
+    `implied_vol_newton` result. Scalar path only; the batch solvers do not go
+    through this cache.
+    """
+    key = _iv_cache_key(market_price, S, K, r, q, tau, option_type, initial_vol, tol, max_iter)
+    return _IV_NEWTON_MEMO.get_or_solve(
+        key,
+        lambda: implied_vol_newton(market_price, S, K, r, q, tau, option_type, initial_vol, tol, max_iter),
+    )
+
+
+def implied_vol_newton_fast(
+    market_price: float,
+    S: float,
+    K: float,
+    r: float,
+    q: float,
+    tau: float,
+    option_type: OptionFlag,
+    initial_vol: Optional[float] = None,
+    tol: float = 1e-6,
+    max_iter: int = 16,
+) -> float:
+    """
+    Compiled `implied_vol_newton`: without `initial_vol`, first a fixed three-step
+    Householder(3) solve (`_bs_numba.iv_householder_scalar`), then the compiled Newton
+    loop `_bs_numba.iv_newton_scalar` for the few contracts it misses (also used directly
+    when `initial_vol` is given). No tracing, even with `_DEBUG_IV`. Without numba it is
+    `implied_vol_newton`'s Python loop. Returns NaN where `implied_vol_newton` would fall back to the bracketed solve.
+    """
+    if tau <= 0 or S <= 0 or K <= 0:
+        return nan
+
+    if _iv_newton_scalar_nb is not None:
+        is_call = _is_call(option_type)
+        if initial_vol is None:
+            # Fixed three Householder(3) steps from Jäckel's normalized guesses; Newton only on a miss
+            iv = _iv_householder_nb(
+                float(market_price), float(S), float(K), float(r), float(q), float(tau), is_call, float(tol),
+            )
+            if not isnan(iv):
+                return float(iv)
+        # NaN initial vol: the kernel seeds itself with the compiled Corrado-Miller guess
+        iv = _iv_newton_scalar_nb(
+            float(market_price), float(S), float(K), float(r), float(q), float(tau),
+            is_call, float(initial_vol) if initial_vol is not None else nan, float(tol), int(max_iter),
         )
+        return float(iv)
+
+    # Without numba this is the Python loop in `implied_vol_newton`
+    return implied_vol_newton(market_price, S, K, r, q, tau, option_type, initial_vol, tol, max_iter)
+
+
+def _normalized_black_call(x: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """
+    Normalized Black call (Jäckel): b(x, s) = e^{x/2} N(x/s + s/2) - e^{-x/2} N(x/s - s/2)
+    with x = ln(F/K) and s = sigma * sqrt(tau).
+    """
+    return np.exp(0.5 * x) * ndtr(x / s + 0.5 * s) - np.exp(-0.5 * x) * ndtr(x / s - 0.5 * s)
+
+
+def _normalized_black_vega(x: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """
+    db/ds of the normalized Black call (no N(.) evaluations needed).
+    """
+    return _INV_SQRT_2PI * np.exp(-0.5 * (x * x / (s * s) + 0.25 * s * s))
 
-        if abs(price - market_price) < tol:
-            print(f"BISECTION SUCCESS → sigma={mid:.6f}")
+
+def _normalized_black_solve(beta: np.ndarray, x: np.ndarray, tol: float, max_iter: int) -> np.ndarray:
+    """
+    Solve b(x, s) = beta for s, for out-of-the-money calls (x <= 0, 0 < beta < e^{x/2}).
+
+    The inflection point s_c = sqrt(2|x|) splits b into a convex lower branch and a
+    concave upper branch (Jäckel). Each branch gets its own closed-form starting
+    guess on the near side of the root:
+      - upper: Householder(3) on b(s) - beta, from the ATM inversion 2 N^{-1}((1 + beta e^{-x/2}) / 2)
+      - lower: Newton on ln b(s) - ln beta, from the leading asymptotic |x| / sqrt(-2 ln beta)
+    Returns NaN for elements that did not converge.
+    """
+    s_c = np.sqrt(2.0 * np.abs(x))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b_c = np.where(s_c > 0, _normalized_black_call(x, s_c), 0.0)
+        s_upper = 2.0 * ndtri(0.5 * (1.0 + beta * np.exp(-0.5 * x)))
+        s_lower = np.abs(x) / np.sqrt(-2.0 * np.log(beta))
+    upper = beta >= b_c
+    s = np.where(upper, np.maximum(s_c, s_upper), np.minimum(s_c, s_lower))
+
+    out = np.full(beta.shape, np.nan)
+    active = np.ones(beta.shape, dtype=bool)
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+
+        si, xi, bi, ci, up = s[idx], x[idx], beta[idx], s_c[idx], upper[idx]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            b = _normalized_black_call(xi, si)
+            v = _normalized_black_vega(xi, si)
+
+            # Householder(3) on the upper branch; b''/b' and b'''/b' are closed-form
+            nu = (bi - b) / v
+            h2 = xi * xi / si**3 - 0.25 * si
+            h3 = h2 * h2 - 3.0 * xi * xi / si**4 - 0.25
+            ds_upper = nu * (1.0 + 0.5 * h2 * nu) / (1.0 + nu * (h2 + h3 * nu / 6.0))
+
+            # Newton on the log objective (b is exponentially flat near s = 0)
+            ds_lower = (np.log(bi) - np.log(b)) * b / v
+
+        # Keep each iterate on its own branch
+        s_new = si + np.where(up, ds_upper, ds_lower)
+        s_new = np.where(up, np.maximum(s_new, ci), np.minimum(s_new, ci))
+
+        bad = ~np.isfinite(s_new) | (s_new <= 0)
+        done = ~bad & (np.abs(s_new - si) <= tol * s_new)
+        out[idx[done]] = s_new[done]
+        s[idx] = s_new
+        active[idx[done | bad]] = False
+
+    return out
+
+
+def implied_vol_rational(
+    price,
+    F,
+    K,
+    tau,
+    is_call,
+    r: float = 0.0,
+    tol: float = 1e-12,
+    max_iter: int = 16,
+):
+    """
+    Implied volatility via Jäckel's normalized Black formulation.
+
+    Works on scalars or NumPy arrays (`tau` may vary per element). Uses `b = price * e^{r tau} / sqrt(F K)` and
+    `x = ln(F / K)`; the time value is mapped onto an out-of-the-money call by
+    put-call symmetry and inverted with branch-specific starting guesses (see
+    `_normalized_black_solve`). If `py_lets_be_rational` is installed it is used
+    instead. Returns NaN (sentinel) where the price is outside arbitrage bounds
+    or the solve fails, so callers can fall back to the bracketed solve.
+    """
+    if tau is None:
+        tau = np.nan
+    prices, F, K, tau, is_call = np.broadcast_arrays(
+        np.asarray(price, dtype=float),
+        np.asarray(F, dtype=float),
+        np.asarray(K, dtype=float),
+        np.asarray(tau, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    out = np.full(prices.shape, np.nan)
+
+    valid = np.isfinite(prices) & (prices > 0) & (F > 0) & (K > 0) & (tau > 0)
+    undiscounted = prices * np.exp(r * tau)
+
+    if _lbr_implied_vol is not None:
+        for i in zip(*np.nonzero(valid)):
+            try:
+                sigma = _lbr_implied_vol(undiscounted[i], F[i], K[i], tau[i], 1.0 if is_call[i] else -1.0)
+            except Exception:
+                continue
+            if isfinite(sigma) and 0 < sigma < 1e6:
+                out[i] = sigma
+        return out if out.ndim else float(out)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.log(F / K)
+        b = undiscounted / np.sqrt(F * K)
+    theta = np.where(is_call, 1.0, -1.0)
+    intrinsic = np.maximum(theta * (np.exp(0.5 * x) - np.exp(-0.5 * x)), 0.0)
+
+    # Time value of any option equals the normalized OTM call at x = -|x|
+    beta = b - intrinsic
+    x_otm = -np.abs(x)
+    valid &= (beta > 0) & (beta < np.exp(0.5 * x_otm))
+
+    out[valid] = _normalized_black_solve(beta[valid], x_otm[valid], tol, max_iter) / np.sqrt(tau[valid])
+    return out if out.ndim else float(out)
+
+
+def _price_from_sigma_fn(S, K, r, q, tau, option_type: OptionFlag) -> Callable[[float], float]:
+    """
+    sigma -> Black-Scholes price for fixed contract inputs, with log(S/K), sqrt(tau) and the
+    discount factors evaluated once. Degenerate inputs keep `black_scholes_price`'s edge handling.
+    """
+    is_call = _is_call(option_type)
+    if not (tau > 0 and S > 0 and K > 0):
+        return lambda sigma: _black_scholes_price_flag(S, K, r, q, sigma, tau, is_call)
+
+    consts = (log(S / K), r, q, tau, sqrt(tau), exp(-r * tau), exp(-q * tau), S, K, 1.0 if is_call else -1.0)
+
+    def price_at(sigma: float) -> float:
+        if sigma <= 0:
+            return _black_scholes_price_flag(S, K, r, q, sigma, tau, is_call)
+        return _bsm_price_from_sigma(sigma, *consts)
+
+    return price_at
+
+
+def implied_vol_bracketed(
+    market_price, S, K, r, q, tau, option_type,
+    low=1e-6, high=5.0, tol=1e-6, max_iter=100
+):
+    """
+    Bracketed IV fallback on [low, high]; without a root in the bracket it returns the nearer
+    end (low if even `low` overprices, else high). With numba installed (and `_DEBUG_IV` off)
+    this is Brent's method, compiled (`_bs_numba.iv_brent_scalar`, ~8 price evaluations);
+    otherwise the Illinois false-position loop below (~10), which prints every step when
+    `_DEBUG_IV` is set. Neither is plain bisection, hence the name; `implied_vol_bisection`
+    is kept as an alias for existing callers.
+    """
+    if _iv_brent_nb is not None and not _DEBUG_IV and tau > 0 and S > 0 and K > 0:
+        return float(_iv_brent_nb(
+            float(market_price), float(S), float(K), float(r), float(q), float(tau),
+            _is_call(option_type), float(low), float(high), float(tol), int(max_iter),
+        ))
+
+    if _DEBUG_IV:
+        print("\n--- BRACKETED START ---")
+        print(f"S={S}, K={K}, tau={tau}, market={market_price}, type={option_type}")
+
+    price_at = _price_from_sigma_fn(S, K, r, q, tau, option_type)
+
+    # Endpoint residuals, carried across iterations (price is increasing in sigma)
+    f_low = price_at(low) - market_price
+    f_high = price_at(high) - market_price
+    if f_low * f_high > 0:
+        # No root in [low, high]: end where halving the bracket would
+        return low if f_low > 0 else high
+
+    mid = (low + high) / 2
+    retained = 0  # +1 / -1 while the low / high endpoint has survived consecutive steps
+    for i in range(max_iter):
+        # False position (Illinois): secant through the endpoints
+        mid = high - f_high * (high - low) / (f_high - f_low)
+        price = price_at(mid)
+        f_mid = price - market_price
+
+        if _DEBUG_IV:
+            print(
+                f"Iter {i} | mid={mid:.6f} | price={price:.6f} | "
+                f"low={low:.6f} | high={high:.6f}"
+            )
+
+        if abs(f_mid) < tol:
+            if _DEBUG_IV:
+                print(f"BRACKETED SUCCESS → sigma={mid:.6f}")
             return mid
 
-        if price > market_price:
-            high = mid
+        # Halve the residual of an endpoint kept twice in a row, so it cannot stall one-sided
+        if f_mid > 0:
+            high, f_high = mid, f_mid
+            if retained == 1:
+                f_low *= 0.5
+            retained = 1
         else:
-            low = mid
+            low, f_low = mid, f_mid
+            if retained == -1:
+                f_high *= 0.5
+            retained = -1
 
-    final_sigma = (low + high) / 2
-    print(f"BISECTION END → sigma={final_sigma:.6f}")
-    return final_sigma
+    if _DEBUG_IV:
+        print(f"BRACKETED END → sigma={mid:.6f}")
+    return mid
 
 
+# Former name (the Python fallback started out as bisection)
+implied_vol_bisection = implied_vol_bracketed
+
 
 def implied_volatility(
     price: float,
@@ -119,58 +579,268 @@ def implied_volatility(
     r: float,
     q: float,
     tau: float,
-    option_type: str,
-    initial_vol: float = 0.2,
+    option_type: OptionFlag,
+    initial_vol: Optional[float] = None,
     tol: float = 1e-6,
     max_iter_newton: int = 30,
     low: float = 1e-6,
     high: float = 5.0,
     max_iter_bisection: int = 200,
-) -> Optional[float]:
+) -> float:
     """
-    Unified solver: Newton first (fast), fallback to robust bisection only if
-    Newton explicitly returns None (indicating no root or numeric issues).
-    Returns None if no plausible IV exists.
+    Unified solver: arbitrage-bound check, puts mapped to calls by parity, then Newton first
+    (fast), fallback to the robust bracketed solve only if Newton returns NaN (its failure sentinel:
+    no root or numeric issues).
+    Returns NaN if no plausible IV exists (missing inputs, tau <= 0, price outside bounds) and
+    0.0 for a quote exactly at the lower bound (no time value), like every other IV entry point.
     """
 
     # quick input guard
     if price is None or S is None or K is None or tau is None:
-        return None
+        return nan
     if tau <= 0:
-        return None
+        return nan
 
-    # try Newton
-    iv_nr = implied_vol_newton(
+    # Arbitrage bounds first: garbage quotes never reach the solvers
+    is_call = _is_call(option_type)
+    lb, ub = _price_bounds_flag(float(S), float(K), float(r), float(q), float(tau), is_call)
+    if price < lb - _PRICE_BOUND_EPS or price > ub + _PRICE_BOUND_EPS:
+        # out of arbitrage bounds -> no valid IV
+        return nan
+    if abs(price - lb) < _PRICE_BOUND_EPS:
+        # no time value -> zero IV
+        return 0.0
+
+    # Put-call parity: a put's IV is that of the call C = P + S e^{-q tau} - K e^{-r tau},
+    # so the solvers below only ever see calls (and puts share their cache entries). They get
+    # the bool flag, not the string, so they do no string work of their own.
+    if not is_call:
+        price = price + S * exp(-q * tau) - K * exp(-r * tau)
+
+    # try Newton (memoized on a rounded key, solved on the exact inputs)
+    iv_nr = implied_vol_cached(
         market_price=price,
         S=S,
         K=K,
         r=r,
         q=q,
         tau=tau,
-        option_type=option_type,
+        option_type=True,
         initial_vol=initial_vol,
         tol=tol,
         max_iter=max_iter_newton,
     )
-    if iv_nr is not None:
+    # NaN is Newton's failure sentinel (as in the compiled kernels)
+    if not isnan(iv_nr) and iv_nr > 0:
         return iv_nr
 
-    # Newton failed; try bisection (only if price is inside arbitrage bounds)
-    lb, ub = _price_bounds(S, K, r, q, tau, option_type)
-    if price < lb - 1e-12 or price > ub + 1e-12:
-        # out of arbitrage bounds -> no valid IV
-        return None
-
-    return implied_vol_bisection(
+    # Newton failed; try the bracketed solve
+    return implied_vol_bracketed(
         market_price=price,
         S=S,
         K=K,
         r=r,
         q=q,
         tau=tau,
-        option_type=option_type,
+        option_type=True,
         low=low,
         high=high,
         tol=tol,
         max_iter=max_iter_bisection,
     )
+
+
+_IV_FULL_MEMO = _RoundedLRU(maxsize=4096)
+
+
+def implied_volatility_cached(
+    price: float,
+    S: float,
+    K: float,
+    r: float,
+    q: float,
+    tau: float,
+    option_type: OptionFlag,
+    initial_vol: Optional[float] = None,
+    tol: float = 1e-6,
+    max_iter_newton: int = 30,
+    low: float = 1e-6,
+    high: float = 5.0,
+    max_iter_bisection: int = 200,
+) -> float:
+    """
+    Memoized `implied_volatility` (LRU, 4096 entries; bounds check, Newton and the bracketed
+    fallback all skipped on a hit), keyed on inputs rounded like `implied_vol_cached`
+    and solved on the exact inputs on a miss.
+    For calibration loops that re-query the same quotes every optimizer iteration.
+    Same NaN / 0.0 sentinels as `implied_volatility`.
+    """
+    if price is None or S is None or K is None or tau is None:
+        return nan
+    key = _iv_cache_key(
+        price, S, K, r, q, tau, option_type,
+        initial_vol, tol, max_iter_newton, low, high, max_iter_bisection,
+    )
+    return _IV_FULL_MEMO.get_or_solve(
+        key,
+        lambda: implied_volatility(
+            price, S, K, r, q, tau, option_type,
+            initial_vol, tol, max_iter_newton, low, high, max_iter_bisection,
+        ),
+    )
+
+
+def implied_volatility_vec(
+    prices: np.ndarray,
+    S: float,
+    K: np.ndarray,
+    r: float,
+    q: float,
+    tau,
+    is_call: np.ndarray,
+    tol: float = 1e-6,
+    low: float = 1e-6,
+    high: float = 5.0,
+    max_iter_brent: int = 100,
+) -> np.ndarray:
+    """
+    Batch counterpart of `implied_volatility` (single S; `tau` scalar or per element,
+    so a whole chain can be solved at once).
+    Rational (Jäckel) solve over the whole batch first, then the scalar bracketed solve
+    (`implied_vol_bracketed`: compiled Brent with numba) only for the elements it left
+    unresolved (and that sit inside arbitrage bounds).
+    Returns NaN where no plausible IV exists and 0.0 where the price sits exactly on the
+    lower bound, as `implied_volatility` does.
+    """
+    prices = np.asarray(prices, dtype=float)
+    K = np.broadcast_to(np.asarray(K, dtype=float), prices.shape)
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), prices.shape)
+
+    if S is None or tau is None:
+        return np.full(prices.shape, np.nan)
+    tau = np.broadcast_to(np.asarray(tau, dtype=float), prices.shape)
+
+    ivs = implied_vol_rational(
+        price=prices,
+        F=S * np.exp((r - q) * tau),
+        K=K,
+        tau=tau,
+        is_call=is_call,
+        r=r,
+    )
+
+    S, r, q = (np.broadcast_to(float(x), prices.shape) for x in (S, r, q))
+    _zero_at_intrinsic(ivs, prices, S, K, r, q, tau, is_call)
+
+    # Rational solve failed on these; try Brent (only if price is inside arbitrage bounds)
+    _brent_fill(ivs, prices, S, K, r, q, tau, is_call, tol, low, high, max_iter_brent)
+    return ivs
+
+
+def _zero_at_intrinsic(ivs, prices, S, K, r, q, tau, is_call) -> None:
+    """
+    In place: 0.0 wherever tau > 0 and the price is within `_PRICE_BOUND_EPS` of the lower
+    arbitrage bound (no time value), the scalar `implied_volatility` convention. Same-shape arrays.
+    """
+    lb, _ = _price_bounds_vec(S, K, r, q, tau, is_call)
+    ivs[(tau > 0) & (np.abs(prices - lb) < _PRICE_BOUND_EPS)] = 0.0
+
+
+def _brent_fill(ivs, prices, S, K, r, q, tau, is_call, tol, low, high, max_iter) -> None:
+    """
+    In place: `implied_vol_bracketed` (the compiled Brent kernel with numba, Illinois without)
+    on every element of `ivs` still NaN with a positive price, tau > 0 and a price inside
+    arbitrage bounds. All arguments are same-shape arrays.
+    """
+    pending = np.flatnonzero(np.isnan(ivs) & np.isfinite(prices) & (prices > 0) & (tau > 0))
+    if pending.size == 0:
+        return
+    lb, ub = _price_bounds_vec(S[pending], K[pending], r[pending], q[pending], tau[pending], is_call[pending])
+    p = prices[pending]
+    for i in pending[(p >= lb - _PRICE_BOUND_EPS) & (p <= ub + _PRICE_BOUND_EPS)]:
+        ivs[i] = implied_vol_bracketed(
+            market_price=prices[i],
+            S=S[i],
+            K=K[i],
+            r=r[i],
+            q=q[i],
+            tau=tau[i],
+            option_type=bool(is_call[i]),
+            low=low,
+            high=high,
+            tol=tol,
+            max_iter=max_iter,
+        )
+
+
+def _flag_to_is_call(flag) -> np.ndarray:
+    """Bool call mask from a bool array or "c"/"C"/"p"/"P" (or "call"/"put") strings."""
+    flag = np.asarray(flag)
+    if flag.dtype == bool:
+        return flag
+    return np.char.startswith(np.char.upper(flag.astype(str)), "C")
+
+
+def implied_volatility_array(
+    price,
+    S,
+    K,
+    r,
+    q,
+    tau,
+    flag,
+    tol: float = 1e-6,
+    max_iter: int = 30,
+    low: float = 1e-6,
+    high: float = 5.0,
+    max_iter_brent: int = 100,
+):
+    """
+    Array API (py_vollib_vectorized style): every argument is a scalar or an array,
+    broadcast together, so a book with mixed spots, rates and maturities is one call.
+    `flag` is a bool call mask or "c"/"p" strings.
+
+    With numba, a parallel Newton kernel solves every element in native code
+    (`_iv_numba.iv_newton_array_kernel`); elements it leaves unsolved, or all of them
+    without numba, go to the rational (Jäckel) solver and then Brent, as in
+    `implied_volatility_vec`. Returns NaN where no plausible IV exists and 0.0 for a price
+    exactly on the lower bound (a float for all-scalar input). `tol` is on price, so where vega ~ 0 (deep in
+    the money) the Newton IV is only as tight as tol / vega.
+    """
+    prices, S, K, r, q, tau, is_call = np.broadcast_arrays(
+        np.asarray(price, dtype=float),
+        np.asarray(S, dtype=float),
+        np.asarray(K, dtype=float),
+        np.asarray(r, dtype=float),
+        np.asarray(q, dtype=float),
+        np.asarray(tau, dtype=float),
+        _flag_to_is_call(flag),
+    )
+    shape = prices.shape
+    prices, S, K, r, q, tau = (np.ascontiguousarray(a).ravel() for a in (prices, S, K, r, q, tau))
+    is_call = np.ascontiguousarray(is_call).ravel()
+
+    # One vectorized bounds pass: quotes outside arbitrage bounds skip every solver (NaN)
+    lb, ub = _price_bounds_vec(S, K, r, q, tau, is_call)
+    in_bounds = (prices >= lb - _PRICE_BOUND_EPS) & (prices <= ub + _PRICE_BOUND_EPS)
+
+    ivs = np.full(prices.shape, np.nan)
+    if _iv_newton_array_nb is not None:
+        # NaN price -> the kernel skips the row
+        _iv_newton_array_nb(np.where(in_bounds, prices, np.nan), S, K, r, q, tau, is_call, ivs, max_iter, tol)
+    _zero_at_intrinsic(ivs, prices, S, K, r, q, tau, is_call)
+
+    pending = np.isnan(ivs) & in_bounds
+    if pending.any():
+        ivs[pending] = implied_vol_rational(
+            price=prices[pending],
+            F=S[pending] * np.exp((r[pending] - q[pending]) * tau[pending]),
+            K=K[pending],
+            tau=tau[pending],
+            is_call=is_call[pending],
+            r=r[pending],
+        )
+        _brent_fill(ivs, prices, S, K, r, q, tau, is_call, tol, low, high, max_iter_brent)
+
+    ivs = ivs.reshape(shape)
+    return ivs if ivs.ndim else float(ivs)
@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.option_pricer.utils.pricers.black_scholes import (
+    black_scholes_price,
+    black_scholes_price_vec,
+    bsm_all_greeks,
+    bsm_delta,
+    bsm_delta_vec,
+    bsm_gamma,
+    bsm_gamma_vec,
+    bsm_rho,
+    bsm_rho_vec,
+    bsm_theta,
+    bsm_theta_vec,
+    bsm_vega,
+    bsm_vega_vec,
+)
+
+
+def _same(vec_value, scalar_value):
+    if math.isnan(scalar_value):
+        return math.isnan(vec_value)
+    return vec_value == pytest.approx(scalar_value, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("sigma", [math.nan, 0.0, 0.25])
+@pytest.mark.parametrize("K", [80.0, 100.0, 270.0])
+@pytest.mark.parametrize("flag", ["C", "P"])
+def test_vec_matches_scalar_on_nan_and_zero_sigma(sigma, K, flag):
+    S, r, q, tau = 100.0, 0.05, 0.01, 0.75
+    is_call = flag == "C"
+    greeks = bsm_all_greeks(S, K, r, q, sigma, tau, is_call)
+
+    cases = [
+        (black_scholes_price_vec(S, K, r, q, sigma, tau, is_call), black_scholes_price(S, K, r, q, sigma, tau, flag)),
+        (bsm_vega_vec(S, K, r, q, sigma, tau), bsm_vega(S, K, r, q, sigma, tau)),
+        (bsm_delta_vec(S, K, r, q, sigma, tau, is_call), bsm_delta(S, K, r, q, sigma, tau, flag)),
+        (bsm_gamma_vec(S, K, r, q, sigma, tau), bsm_gamma(S, K, r, q, sigma, tau)),
+        (bsm_theta_vec(S, K, r, q, sigma, tau, is_call), bsm_theta(S, K, r, q, sigma, tau, flag)),
+        (bsm_rho_vec(S, K, r, q, sigma, tau, is_call), bsm_rho(S, K, r, q, sigma, tau, flag)),
+        (greeks["price"], black_scholes_price(S, K, r, q, sigma, tau, flag)),
+        (greeks["delta"], bsm_delta(S, K, r, q, sigma, tau, flag)),
+        (greeks["gamma"], bsm_gamma(S, K, r, q, sigma, tau)),
+        (greeks["theta"], bsm_theta(S, K, r, q, sigma, tau, flag)),
+        (greeks["rho"], bsm_rho(S, K, r, q, sigma, tau, flag)),
+        (greeks["vega"], bsm_vega(S, K, r, q, sigma, tau)),
+    ]
+    for i, (vec_value, scalar_value) in enumerate(cases):
+        assert _same(float(vec_value), scalar_value), (i, float(vec_value), scalar_value)
+
+
+def test_nan_sigma_rows_stay_nan_in_a_batch():
+    # An unsolved IV (NaN) must not price as a deep-ITM forward (used to give -169.02 here)
+    sigma = np.array([0.2, np.nan, 0.0])
+    prices = black_scholes_price_vec(100.0, 270.0, 0.05, 0.0, sigma, 1.0, True)
+    deltas = bsm_delta_vec(100.0, 270.0, 0.05, 0.0, sigma, 1.0, True)
+
+    assert prices[0] > 0.0 and prices[2] == 0.0
+    assert np.isnan(prices[1]) and np.isnan(deltas[1])
+    # Expired: intrinsic whatever sigma is, as in the scalar path
+    assert black_scholes_price_vec(100.0, 90.0, 0.05, 0.0, np.nan, 0.0, True) == 10.0
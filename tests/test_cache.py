@@ -0,0 +1,50 @@
+import os
+import time
+
+from src.option_pricer.utils.data.cache import FileCache
+from src.option_pricer.utils.data.data_loader import LoaderConfig, MarketDataLoader
+
+
+def test_round_trip_and_key_separation(tmp_path):
+    cache = FileCache(str(tmp_path), ttl_s=60)
+    cache.set("spot", 101.5, "AAPL", "2025-01-02")
+    cache.set("spot", "split", "AAP", "L2025-01-02")   # same characters, different parts
+
+    assert cache.get("spot", "AAPL", "2025-01-02") == 101.5
+    assert cache.get("spot", "AAP", "L2025-01-02") == "split"
+    # Same key parts under another namespace are a different entry
+    assert cache.get("expiry", "AAPL", "2025-01-02") is None
+    assert cache.get("spot", "MSFT", "2025-01-02") is None
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = FileCache(str(tmp_path), ttl_s=60)
+    cache.set("spot", 1.0, "AAPL")
+    path = cache._path("spot", "AAPL")
+
+    old = time.time() - 61
+    os.utime(path, (old, old))
+    assert cache.get("spot", "AAPL") is None
+
+    cache.set("spot", 2.0, "AAPL")   # a rewrite refreshes the mtime
+    assert cache.get("spot", "AAPL") == 2.0
+
+
+def test_bad_files_read_as_misses(tmp_path):
+    cache = FileCache(str(tmp_path), ttl_s=60)
+    cache.set("spot", 1.0, "AAPL")
+    with open(cache._path("spot", "AAPL"), "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.get("spot", "AAPL") is None
+
+    # An unwritable cache dir is logged, not raised
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    FileCache(str(blocker), ttl_s=60).set("spot", 1.0, "AAPL")
+    assert FileCache(str(blocker), ttl_s=60).get("spot", "AAPL") is None
+
+
+def test_loader_cache_is_opt_in(tmp_path):
+    assert MarketDataLoader(LoaderConfig()).cache is None
+    loader = MarketDataLoader(LoaderConfig(cache_dir=str(tmp_path)))
+    assert isinstance(loader.cache, FileCache) and loader.cache.cache_dir == str(tmp_path)
@@ -0,0 +1,246 @@
+import asyncio
+import datetime as dt
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.option_pricer.models.option import OptionChain, OptionContract
+from src.option_pricer.utils.data import data_loader as dl
+from src.option_pricer.utils.data.data_loader import LoaderConfig, MarketDataLoader
+
+
+class FakeChain:
+    def __init__(self, calls, puts):
+        self.calls = calls
+        self.puts = puts
+
+
+class FakeTicker:
+    """yf.Ticker stand-in: two expiries, two strikes per side, call counts per expiry."""
+
+    calls = {}
+
+    def __init__(self, ticker, session=None):
+        self.ticker = ticker
+        today = dt.datetime.utcnow().date()
+        self.options = [(today + dt.timedelta(days=d)).isoformat() for d in (30, 90)]
+        self.fast_info = {"last_price": 100.0}
+
+    def option_chain(self, expiry):
+        FakeTicker.calls[expiry] = FakeTicker.calls.get(expiry, 0) + 1
+
+        def side(flag):
+            return pd.DataFrame({
+                "contractSymbol": [f"X{expiry}{flag}{k}" for k in (95, 105)],
+                "strike": [95.0, 105.0],
+                "bid": [4.0, 2.0],
+                "ask": [4.2, 2.1],
+                "lastPrice": [4.1, 2.05],
+                "volume": [10, 20],
+                "openInterest": [100, 200],
+            })
+
+        return FakeChain(side("C"), side("P"))
+
+
+@pytest.fixture
+def fake_yf(monkeypatch):
+    FakeTicker.calls = {}
+    monkeypatch.setattr(dl.yf, "Ticker", FakeTicker)
+    return FakeTicker
+
+
+def test_async_path_matches_threaded_and_uses_the_cache(fake_yf, tmp_path):
+    threaded = MarketDataLoader(LoaderConfig()).get_option_chain("X", filter=False)
+    assert len(threaded) == 8
+
+    config = LoaderConfig(use_async=True, cache_dir=str(tmp_path))
+    first = MarketDataLoader(config).get_option_chain("X", filter=False)
+    assert first.symbols.tolist() == threaded.symbols.tolist()
+    assert all(n == 2 for n in fake_yf.calls.values())   # threaded + first async load
+
+    # A second loader on the same cache dir serves every expiry from disk
+    again = MarketDataLoader(config).get_option_chain("X", filter=False)
+    assert again.symbols.tolist() == threaded.symbols.tolist()
+    assert all(n == 2 for n in fake_yf.calls.values())
+
+
+def test_async_fan_out_is_capped_at_max_workers(fake_yf, monkeypatch):
+    today = dt.datetime.utcnow().date()
+    expiries = [(today + dt.timedelta(days=d)).isoformat() for d in range(1, 13)]
+    active = peak = 0
+    lock = threading.Lock()
+
+    def slow_load(self, tk, expiry, spot):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return []
+
+    monkeypatch.setattr(MarketDataLoader, "_load_single_expiry_with_retry", slow_load)
+    loader = MarketDataLoader(LoaderConfig(use_async=True, max_workers=3))
+
+    by_expiry = asyncio.run(loader._load_expiries_async(FakeTicker("X"), "X", expiries, 100.0))
+
+    assert sorted(by_expiry) == expiries
+    assert peak == 3
+
+
+def test_request_semaphore_is_shared_across_loaders(fake_yf, monkeypatch):
+    config = LoaderConfig(max_workers=8, max_concurrent_requests=2)
+    first, second = MarketDataLoader(config), MarketDataLoader(config)
+    assert first._rate_sem is second._rate_sem
+    assert MarketDataLoader(LoaderConfig(max_concurrent_requests=3))._rate_sem is not first._rate_sem
+
+    active = peak = 0
+    lock = threading.Lock()
+
+    def slow_call():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    # Two loaders, 8 threads each: still at most 2 calls in flight
+    threads = [
+        threading.Thread(target=loader._retry_loop, args=(slow_call,))
+        for loader in (first, second) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak == 2
+
+
+def test_streaming_solve_iv_hook_fills_each_shard(fake_yf):
+    seen = []
+
+    def solve_iv(shard, spot):
+        seen.append((len(shard), spot))
+        for c in shard:
+            c.implied_vol = 0.2
+
+    shards = list(MarketDataLoader(LoaderConfig()).get_option_chain_streaming("X", solve_iv=solve_iv))
+
+    assert seen == [(4, 100.0), (4, 100.0)]
+    assert all(c.implied_vol == 0.2 for shard in shards for c in shard)
+    # Without the hook the shards come out unsolved
+    plain = list(MarketDataLoader(LoaderConfig()).get_option_chain_streaming("X"))
+    assert all(c.implied_vol is None for shard in plain for c in shard)
+
+
+def _liquidity_chain():
+    rows = [
+        # bid, ask, last, volume, oi
+        (1.0, 1.2, 1.1, 5, 50),        # liquid
+        (1.0, 1.5, 1.2, 5, 50),        # spread 50%
+        (1.0, 1.2, 1.1, 5, 5),         # open interest below 10
+        (1.0, 1.2, 1.1, None, 50),     # missing volume counts as 0
+        (None, None, 2.0, 5, 50),      # no quote: mid falls back to last, no spread check
+        (None, None, None, 5, 50),     # no quote and no last: no mid
+        (0.0, 0.5, 0.2, 5, 50),        # zero bid: spread check skipped
+    ]
+    contracts = [
+        OptionContract(f"X{i}", "X", "2025-03-21", 100.0 + i, "C", bid, ask, last, vol, oi)
+        for i, (bid, ask, last, vol, oi) in enumerate(rows)
+    ]
+    chain = OptionChain.from_contracts("X", "2025-01-02", 100.0, contracts)
+    chain.enrich()
+    return chain
+
+
+def test_liquidity_mask_tags_and_filters_the_same_rows():
+    loader = MarketDataLoader(LoaderConfig())
+    chain = _liquidity_chain()
+
+    mask = loader._liquidity_mask(chain)
+    assert mask.tolist() == [True, False, False, False, True, False, True]
+
+    loader._tag_liquidity(chain)
+    np.testing.assert_array_equal(chain.is_liquid, mask)
+    assert loader._filter_chain(chain).symbols.tolist() == ["X0", "X4", "X6"]
+
+    # Thresholds come from the config
+    loose = MarketDataLoader(LoaderConfig(min_open_interest=0, min_volume=0, max_spread_pct=1.0))
+    assert loose._liquidity_mask(chain).tolist() == [True, True, True, True, True, False, True]
+
+
+class HTTPError(Exception):
+    """Error carrying a response with status_code / headers, like requests' HTTPError."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.response = type("Response", (), {"status_code": status, "headers": headers or {}})()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr(dl.time, "sleep", waits.append)
+    return waits
+
+
+def _flaky(*errors):
+    """Callable raising each error in turn, then returning "ok"; counts its calls."""
+    pending = list(errors)
+
+    def call():
+        call.count += 1
+        if pending:
+            raise pending.pop(0)
+        return "ok"
+
+    call.count = 0
+    return call
+
+
+def test_retry_loop_retries_429_and_5xx_then_succeeds(sleeps):
+    loader = MarketDataLoader(LoaderConfig(retries=3, backoff_factor=0.1))
+    call = _flaky(HTTPError(429), HTTPError(503), ConnectionError("reset"))
+
+    assert loader._retry_loop(call) == "ok"
+    assert call.count == 4
+    # Jittered exponential backoff: 0.1 * 2**attempt, +/-50%
+    assert len(sleeps) == 3
+    for attempt, wait in enumerate(sleeps):
+        assert 0.5 * 0.1 * 2 ** attempt <= wait <= 1.5 * 0.1 * 2 ** attempt
+
+
+def test_retry_loop_does_not_retry_other_http_errors(sleeps):
+    loader = MarketDataLoader(LoaderConfig(retries=3))
+    call = _flaky(HTTPError(404))
+
+    assert loader._backoff_wait(0, HTTPError(404)) is None
+    with pytest.raises(HTTPError):
+        loader._retry_loop(call)
+    assert call.count == 1 and sleeps == []
+
+
+def test_retry_after_is_honoured_and_capped(sleeps):
+    loader = MarketDataLoader(LoaderConfig(max_wait_s=5.0))
+
+    assert loader._backoff_wait(0, HTTPError(429, {"Retry-After": "2"})) == 2.0
+    assert loader._backoff_wait(0, HTTPError(503, {"Retry-After": "120"})) == 5.0
+    # Non-numeric Retry-After (HTTP-date form) falls back to capped backoff
+    assert loader._backoff_wait(10, HTTPError(429, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})) <= 1.5 * 5.0
+
+
+def test_retry_loop_gives_up_after_retries(sleeps):
+    loader = MarketDataLoader(LoaderConfig(retries=2, backoff_factor=0.01))
+    call = _flaky(*(HTTPError(500) for _ in range(5)))
+
+    with pytest.raises(HTTPError):
+        loader._retry_loop(call)
+    assert call.count == 3
+    assert len(sleeps) == 2
@@ -0,0 +1,193 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.option_pricer.utils.pricers import implied_volatility as iv_mod
+from src.option_pricer.utils.pricers.black_scholes import black_scholes_price, black_scholes_price_vec
+from src.option_pricer.utils.pricers.implied_volatility import (
+    implied_vol_bisection,
+    implied_vol_bracketed,
+    implied_vol_cached,
+    implied_volatility,
+    implied_volatility_array,
+    implied_volatility_cached,
+    implied_volatility_vec,
+)
+
+_HAS_NUMBA = iv_mod._iv_newton_array_nb is not None
+
+
+@pytest.fixture(params=["numba", "python"])
+def solver_path(request, monkeypatch):
+    """Runs a test on the compiled kernels and again with every numba hook switched off."""
+    if request.param == "numba" and not _HAS_NUMBA:
+        pytest.skip("numba not installed")
+    if request.param == "python":
+        for name in (
+            "_iv_newton_array_nb",
+            "_iv_newton_scalar_nb",
+            "_iv_householder_nb",
+            "_iv_brent_nb",
+            "_corrado_miller_nb",
+        ):
+            monkeypatch.setattr(iv_mod, name, None)
+        monkeypatch.setattr(iv_mod, "_price_bounds_flag", iv_mod._price_bounds_py)
+    # Memoized results from the other path must not leak into this one
+    iv_mod._IV_NEWTON_MEMO.cache_clear()
+    iv_mod._IV_FULL_MEMO.cache_clear()
+    yield request.param
+    iv_mod._IV_NEWTON_MEMO.cache_clear()
+    iv_mod._IV_FULL_MEMO.cache_clear()
+
+
+def _random_book(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(20.0, 200.0, n)
+    K = S * rng.uniform(0.7, 1.3, n)
+    r = rng.uniform(0.0, 0.08, n)
+    q = rng.uniform(0.0, 0.04, n)
+    tau = rng.uniform(0.1, 2.0, n)
+    sigma = rng.uniform(0.1, 0.8, n)
+    is_call = rng.random(n) < 0.5
+    return S, K, r, q, tau, sigma, is_call
+
+
+def test_array_round_trip(solver_path):
+    S, K, r, q, tau, sigma, is_call = _random_book()
+    prices = black_scholes_price_vec(S, K, r, q, sigma, tau, is_call)
+
+    ivs = implied_volatility_array(prices, S, K, r, q, tau, is_call)
+
+    assert not np.isnan(ivs).any()
+    repriced = black_scholes_price_vec(S, K, r, q, ivs, tau, is_call)
+    # tol is on price: deep in the money (vega ~ 0) only the repriced quote is tight
+    np.testing.assert_allclose(repriced, prices, rtol=0.0, atol=1e-5)
+
+
+def test_array_put_call_parity(solver_path):
+    S, K, r, q, tau, sigma, _ = _random_book(seed=1)
+    calls = black_scholes_price_vec(S, K, r, q, sigma, tau, np.ones_like(S, dtype=bool))
+    puts = black_scholes_price_vec(S, K, r, q, sigma, tau, np.zeros_like(S, dtype=bool))
+
+    iv_c = implied_volatility_array(calls, S, K, r, q, tau, "c")
+    iv_p = implied_volatility_array(puts, S, K, r, q, tau, "p")
+
+    np.testing.assert_allclose(iv_p, iv_c, rtol=0.0, atol=1e-4)
+
+
+def test_array_broadcasting_and_string_flags(solver_path):
+    S, r, q, sigma = 100.0, 0.03, 0.01, 0.25
+    K = np.array([[80.0], [100.0], [120.0]])
+    tau = np.array([[0.25, 0.5, 1.0, 2.0]])
+    flags = np.array([["c", "p", "c", "p"]])
+    prices = black_scholes_price_vec(S, K, r, q, sigma, tau, flags == "c")
+
+    ivs = implied_volatility_array(prices, S, K, r, q, tau, flags)
+
+    assert ivs.shape == (3, 4)
+    np.testing.assert_allclose(ivs, sigma, rtol=0.0, atol=1e-4)
+
+    scalar = implied_volatility_array(float(prices[1, 2]), S, 100.0, r, q, 1.0, "c")
+    assert isinstance(scalar, float)
+    assert scalar == pytest.approx(sigma, abs=1e-4)
+
+
+def test_array_out_of_bounds_is_nan(solver_path):
+    S, K, r, q, tau = 100.0, 100.0, 0.05, 0.0, 1.0
+    upper = S * math.exp(-q * tau)                            # call upper bound
+    lower = S * math.exp(-q * tau) - K * math.exp(-r * tau)   # call lower bound
+    fair = black_scholes_price(S, K, r, q, 0.2, tau, "C")
+
+    ivs = implied_volatility_array(
+        np.array([upper + 1.0, lower - 1.0, -1.0, np.nan, fair]), S, K, r, q, tau, True,
+    )
+
+    assert np.isnan(ivs[:4]).all()
+    assert ivs[4] == pytest.approx(0.2, abs=1e-4)
+
+
+@pytest.mark.parametrize("solve", [implied_volatility, implied_volatility_cached])
+def test_scalar_solve_reprices_on_exact_inputs(solver_path, solve):
+    # r and q with more than 6 decimals: rounding them before the solve used to move
+    # the repriced quote by ~1e-4 on long-dated contracts
+    cases = [(40.0, 42.0812, 0.0437123, 0.0130775, 2.485, 0.76955, "P")]
+    S, K, r, q, tau, sigma, is_call = _random_book(n=200, seed=2)
+    tau = tau + 1.0
+    cases += [
+        (S[i], K[i], r[i], q[i], tau[i], sigma[i], "C" if is_call[i] else "P")
+        for i in range(len(S))
+    ]
+    for S_i, K_i, r_i, q_i, tau_i, sigma_i, flag in cases:
+        price = black_scholes_price(S_i, K_i, r_i, q_i, sigma_i, tau_i, flag)
+        iv = solve(price, S_i, K_i, r_i, q_i, tau_i, flag)
+        assert not math.isnan(iv)
+        assert abs(black_scholes_price(S_i, K_i, r_i, q_i, iv, tau_i, flag) - price) < 1e-5
+
+
+def test_sentinels_agree_across_entry_points(solver_path):
+    # NaN = no IV, 0.0 only for a quote exactly on the lower bound, on every entry point
+    S, K, r, q, tau = 100.0, 90.0, 0.05, 0.01, 1.0
+    call_lb = S * math.exp(-q * tau) - K * math.exp(-r * tau)
+    put_lb = 0.0  # OTM put: lower bound is 0
+    fair = black_scholes_price(S, K, r, q, 0.3, tau, "C")
+    prices = np.array([call_lb, call_lb - 1.0, S + 1.0, fair, put_lb])
+    flags = np.array([True, True, True, True, False])
+    expected = [0.0, math.nan, math.nan, 0.3, 0.0]
+
+    vec = implied_volatility_vec(prices, S, K, r, q, tau, flags)
+    arr = implied_volatility_array(prices, S, K, r, q, tau, flags)
+    for i, want in enumerate(expected):
+        scalar = implied_volatility(prices[i], S, K, r, q, tau, "C" if flags[i] else "P")
+        cached = implied_volatility_cached(prices[i], S, K, r, q, tau, "C" if flags[i] else "P")
+        for got in (scalar, cached, vec[i], arr[i]):
+            if math.isnan(want):
+                assert math.isnan(got)
+            else:
+                assert got == pytest.approx(want, abs=1e-4)
+
+    # Missing inputs and expired contracts: NaN, never None
+    assert math.isnan(implied_volatility(None, S, K, r, q, tau, "C"))
+    assert math.isnan(implied_volatility_cached(fair, S, K, r, q, None, "C"))
+    assert math.isnan(implied_volatility(fair, S, K, r, q, 0.0, "C"))
+    assert np.isnan(implied_volatility_array(fair, S, K, r, q, 0.0, "C"))
+
+
+def test_newton_memo_hit_and_nan_sentinel(solver_path):
+    price = black_scholes_price(100.0, 100.0, 0.05, 0.0, 0.2, 1.0, "C")
+
+    first = implied_vol_cached(price, 100.0, 100.0, 0.05, 0.0, 1.0, "C")
+    # Same key after rounding -> same cached value
+    assert implied_vol_cached(price + 1e-9, 100.0, 100.0, 0.05, 0.0, 1.0, "C") == first
+    assert first == pytest.approx(0.2, abs=1e-5)
+
+    # Degenerate input: NaN, not None
+    assert math.isnan(implied_vol_cached(price, 100.0, 100.0, 0.05, 0.0, 0.0, "C"))
+
+
+def test_bracketed_illinois_python_path(monkeypatch):
+    # Python fallback only: the Illinois false-position loop, not the compiled Brent kernel
+    monkeypatch.setattr(iv_mod, "_iv_brent_nb", None)
+    S, K, r, q, tau, sigma, is_call = _random_book(n=200, seed=4)
+    calls = 0
+    real_price_from_sigma = iv_mod._bsm_price_from_sigma
+
+    def counting(*args):
+        nonlocal calls
+        calls += 1
+        return real_price_from_sigma(*args)
+
+    monkeypatch.setattr(iv_mod, "_bsm_price_from_sigma", counting)
+    for i in range(len(S)):
+        flag = "C" if is_call[i] else "P"
+        price = black_scholes_price(S[i], K[i], r[i], q[i], sigma[i], tau[i], flag)
+        iv = implied_vol_bracketed(price, S[i], K[i], r[i], q[i], tau[i], flag, tol=1e-9)
+        assert abs(black_scholes_price(S[i], K[i], r[i], q[i], iv, tau[i], flag) - price) < 1e-8
+    # Illinois converges superlinearly: far fewer evaluations than bisection's ~40 per solve
+    assert calls / len(S) < 20
+
+    # No root in the bracket: the nearer end
+    price = black_scholes_price(100.0, 100.0, 0.05, 0.0, 0.2, 1.0, "C")
+    assert implied_vol_bracketed(price, 100.0, 100.0, 0.05, 0.0, 1.0, "C", low=0.5, high=1.0) == 0.5
+    assert implied_vol_bracketed(price, 100.0, 100.0, 0.05, 0.0, 1.0, "C", low=0.01, high=0.1) == 0.1
+    assert implied_vol_bisection is implied_vol_bracketed
@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from src.option_pricer.utils.pricers import implied_volatility as iv_mod
+from src.option_pricer.utils.pricers._bs_numba import iv_householder_scalar
+from src.option_pricer.utils.pricers._iv_numba import iv_greeks_kernel
+from src.option_pricer.utils.pricers.black_scholes import black_scholes_price_vec, bsm_all_greeks
+
+
+def test_iv_greeks_kernel_matches_bsm_all_greeks():
+    rng = np.random.default_rng(3)
+    n = 400
+    S, r, q = 100.0, 0.04, 0.015
+    K = S * rng.uniform(0.8, 1.2, n)
+    tau = rng.uniform(0.1, 2.0, n)
+    sigma = rng.uniform(0.1, 0.6, n)
+    is_call = rng.random(n) < 0.5
+    prices = black_scholes_price_vec(S, K, r, q, sigma, tau, is_call)
+
+    out = tuple(np.empty(n) for _ in range(5))
+    iv_greeks_kernel(prices, S, K, r, q, tau, is_call, *out, 30, 1e-8)
+    ivs, delta, gamma, theta, rho = out
+
+    solved = ~np.isnan(ivs)
+    assert solved.mean() > 0.95
+    np.testing.assert_allclose(ivs[solved], sigma[solved], rtol=0.0, atol=1e-5)
+
+    # Greeks at the kernel's own IV must be bsm_all_greeks at that IV
+    greeks = bsm_all_greeks(S, K[solved], r, q, ivs[solved], tau[solved], is_call[solved])
+    for name, values in (("delta", delta), ("gamma", gamma), ("theta", theta), ("rho", rho)):
+        np.testing.assert_allclose(values[solved], greeks[name], rtol=1e-9, atol=1e-10, err_msg=name)
+
+    # Unsolved rows carry NaN for every output
+    for values in out:
+        assert np.isnan(values[~solved]).all()
+
+
+def test_iv_greeks_kernel_invalid_inputs_are_nan():
+    prices = np.array([-1.0, np.nan, 5.0, 5.0])
+    K = np.array([100.0, 100.0, 0.0, 100.0])
+    tau = np.array([1.0, 1.0, 1.0, 0.0])
+    out = tuple(np.empty(4) for _ in range(5))
+
+    iv_greeks_kernel(prices, 100.0, K, 0.05, 0.0, tau, np.ones(4, dtype=bool), *out, 30, 1e-6)
+
+    for values in out:
+        assert np.isnan(values).all()
+
+
+def test_householder_recovers_sigma_in_three_steps():
+    rng = np.random.default_rng(5)
+    n = 400
+    S = rng.uniform(20.0, 200.0, n)
+    K = S * rng.uniform(0.7, 1.3, n)
+    r = rng.uniform(0.0, 0.08, n)
+    q = rng.uniform(0.0, 0.04, n)
+    tau = rng.uniform(0.05, 2.0, n)
+    sigma = rng.uniform(0.05, 1.0, n)
+    is_call = rng.random(n) < 0.5
+    prices = black_scholes_price_vec(S, K, r, q, sigma, tau, is_call)
+
+    ivs = np.array([
+        iv_householder_scalar(prices[i], S[i], K[i], r[i], q[i], tau[i], bool(is_call[i]), 1e-8)
+        for i in range(n)
+    ])
+
+    solved = ~np.isnan(ivs)
+    assert solved.mean() > 0.95
+    # Accepted iterates reprice within tol
+    repriced = black_scholes_price_vec(S[solved], K[solved], r[solved], q[solved], ivs[solved], tau[solved], is_call[solved])
+    np.testing.assert_allclose(repriced, prices[solved], rtol=0.0, atol=1e-8)
+
+
+def test_householder_miss_is_nan_and_newton_fast_falls_back(monkeypatch):
+    S, K, r, q, tau = 100.0, 100.0, 0.05, 0.0, 1.0
+    price = float(black_scholes_price_vec(S, K, r, q, 0.2, tau, True))
+
+    # Outside the no-arbitrage bounds, or a tolerance three steps cannot meet
+    assert math.isnan(iv_householder_scalar(S + 1.0, S, K, r, q, tau, True, 1e-8))
+    assert math.isnan(iv_householder_scalar(-1.0, S, K, r, q, tau, True, 1e-8))
+    assert math.isnan(iv_householder_scalar(price, S, K, r, q, tau, True, 0.0))
+
+    # implied_vol_newton_fast hands a Householder miss to the compiled Newton loop
+    monkeypatch.setattr(iv_mod, "_iv_householder_nb", lambda *args: math.nan)
+    assert iv_mod.implied_vol_newton_fast(price, S, K, r, q, tau, "C") == pytest.approx(0.2, abs=1e-6)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from src.option_pricer.models.option import OptionContract
+from src.option_pricer.utils.data_processors.iv_surface_builder import IVFrameAccumulator, IVSurfaceBuilder
+from src.option_pricer.utils.data_processors.option_chain_processor import OptionChainProcessor
+from src.option_pricer.utils.pricers.black_scholes import black_scholes_price
+
+S, R, Q, SIGMA = 100.0, 0.04, 0.01, 0.25
+STRIKES = (90.0, 100.0, 110.0)
+
+
+def _shard(expiry, tau):
+    """One expiry's contracts as the loader streams them: mid and maturity_years set, no IV."""
+    shard = []
+    for strike in STRIKES:
+        for option_type in ("C", "P"):
+            mid = black_scholes_price(S, strike, R, Q, SIGMA, tau, option_type)
+            shard.append(OptionContract(
+                symbol=f"X{expiry}{option_type}{strike:g}", underlying="X", expiry=expiry,
+                strike=strike, option_type=option_type, bid=mid - 0.01, ask=mid + 0.01,
+                last=mid, volume=10, open_interest=100, mid=mid, maturity_years=tau,
+            ))
+    return shard
+
+
+def _stream():
+    # Completion order, not expiry order
+    return [_shard("2026-03-01", 0.5), _shard("2025-12-01", 0.25), _shard("2026-09-01", 1.0)]
+
+
+def test_incremental_frame_from_solved_shards_builds_surfaces():
+    processor = OptionChainProcessor(risk_free_rate=R, dividend_yield=Q)
+    shards = (processor.solve_contracts(shard, S) for shard in _stream())
+
+    df = IVSurfaceBuilder.to_dataframe_incremental(shards)
+    calls, puts = IVSurfaceBuilder.build_iv_surfaces(df)
+
+    for surface in (calls, puts):
+        assert surface.shape == (len(STRIKES), 3)
+        assert surface.index.tolist() == list(STRIKES)
+        assert surface.columns.tolist() == [0.25, 0.5, 1.0]
+        np.testing.assert_allclose(surface.to_numpy(), SIGMA, rtol=0.0, atol=1e-4)
+
+
+def test_incremental_frame_matches_to_dataframe():
+    processor = OptionChainProcessor(risk_free_rate=R, dividend_yield=Q)
+    shards = [processor.solve_contracts(shard, S) for shard in _stream()]
+    flat = [c for shard in shards for c in shard]
+
+    acc = IVFrameAccumulator(capacity=1)   # forces the columns to grow
+    for shard in shards:
+        acc.append(shard)
+
+    assert len(acc) == len(flat)
+    expected = IVSurfaceBuilder.to_dataframe(flat)
+    got = acc.to_dataframe()
+    assert got.columns.tolist() == expected.columns.tolist()
+    assert got["expiry"].tolist() == expected["expiry"].tolist()
+    assert got["type"].tolist() == expected["type"].tolist()
+    for col in ("maturity_years", "strike", "iv"):
+        np.testing.assert_allclose(got[col].to_numpy(), expected[col].to_numpy(dtype=float))
+
+
+def test_unsolved_shards_leave_no_surface():
+    shard = _shard("2026-03-01", 0.5)
+    shard[0].mid = None
+    shard[1].maturity_years = 0.0
+
+    OptionChainProcessor(risk_free_rate=R, dividend_yield=Q).solve_contracts(shard, S)
+    assert shard[0].implied_vol is None and shard[1].implied_vol is None
+    assert shard[2].implied_vol == pytest.approx(SIGMA, abs=1e-4)
+
+    # No spot: nothing solved, so both surfaces come out empty
+    OptionChainProcessor().solve_contracts(shard, None)
+    assert all(c.implied_vol is None for c in shard)
+    calls, puts = IVSurfaceBuilder.build_iv_surfaces(IVSurfaceBuilder.to_dataframe_incremental([shard]))
+    assert calls.empty and puts.empty
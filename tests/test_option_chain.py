@@ -0,0 +1,156 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.option_pricer.models.option import OptionChain, OptionContract
+
+
+def _contract(expiry, strike, option_type="C", bid=1.0, ask=1.2, last=1.1, volume=5, oi=50):
+    return OptionContract(
+        symbol=f"X{expiry}{option_type}{strike:g}",
+        underlying="X",
+        expiry=expiry,
+        strike=strike,
+        option_type=option_type,
+        bid=bid,
+        ask=ask,
+        last=last,
+        volume=volume,
+        open_interest=oi,
+    )
+
+
+def _chain():
+    contracts = [
+        _contract("2025-03-21", 90.0),
+        _contract("2025-03-21", 100.0, "P", bid=None, ask=None, last=2.0),
+        _contract("2025-06-20", 110.0, volume=0, oi=0),
+    ]
+    chain = OptionChain.from_contracts("X", "2025-01-02", 100.0, contracts)
+    chain.enrich()
+    return chain
+
+
+def test_from_contracts_round_trips_through_contracts():
+    contracts = [
+        _contract("2025-03-21", 90.0),
+        _contract("2025-03-21", 100.0, "P", bid=None, ask=None, last=None, volume=None, oi=None),
+    ]
+    contracts[0].implied_vol = 0.2
+    contracts[0].maturity_years = 0.25
+
+    chain = OptionChain.from_contracts("X", "2025-01-02", 100.0, contracts)
+
+    assert len(chain) == 2
+    assert chain.types.tolist() == [0, 1]
+    assert np.isnan(chain.bids[1]) and np.isnan(chain.volumes[1])
+    assert chain.is_liquid is None
+    # Missing values come back as None (ints as int), not NaN
+    assert chain.contracts == contracts
+    assert isinstance(chain.contracts[0].volume, int)
+
+    contracts[1].is_liquid = False
+    tagged = OptionChain.from_contracts("X", "2025-01-02", 100.0, contracts)
+    assert tagged.is_liquid.tolist() == [False, False]
+
+    empty = OptionChain.from_contracts("X", "2025-01-02")
+    assert len(empty) == 0 and empty.contracts == [] and empty.expiries() == []
+
+
+def test_select_indexes_every_column():
+    chain = _chain()
+    chain.is_liquid = np.array([True, False, True])
+
+    by_mask = chain.select(np.array([True, False, True]))
+    by_index = chain.select(np.array([2, 0]))
+
+    assert by_mask.symbols.tolist() == [chain.symbols[0], chain.symbols[2]]
+    assert by_mask.is_liquid.tolist() == [True, True]
+    assert by_index.strikes.tolist() == [110.0, 90.0]
+    assert by_index.maturity_years.tolist() == [chain.maturity_years[2], chain.maturity_years[0]]
+    assert (by_mask.underlying, by_mask.as_of, by_mask.spot) == ("X", "2025-01-02", 100.0)
+    # A new chain: the original is untouched
+    assert len(chain) == 3
+
+
+def test_enrich_derives_mid_moneyness_and_maturity():
+    chain = _chain()
+
+    # bid/ask average, last trade where the quote is missing
+    np.testing.assert_allclose(chain.mids, [1.1, 2.0, 1.1])
+    np.testing.assert_allclose(chain.moneyness, [0.9, 1.0, 1.1])
+    np.testing.assert_allclose(chain.maturity_years, [78 / 365, 78 / 365, 169 / 365])
+
+    expired = OptionChain.from_contracts("X", "2025-04-01", None, [_contract("2025-03-21", 90.0)])
+    expired.enrich()
+    assert expired.maturity_years.tolist() == [0.0]
+    assert np.isnan(expired.moneyness).all()   # no spot: moneyness untouched
+
+    bad_date = OptionChain.from_contracts("X", "not-a-date", 100.0, [_contract("2025-03-21", 90.0)])
+    bad_date.enrich()
+    assert np.isnan(bad_date.maturity_years).all()
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, ["X2025-03-21C90"]),                        # stale last and zero OI/volume dropped
+        ({"ignore_stale_last": False, "min_oi": 0, "min_volume": 0}, ["X2025-03-21C90", "X2025-03-21P100", "X2025-06-20C110"]),
+        ({"max_spread_pct": 0.1}, []),                   # 0.2 / 1.0 = 20% spread
+    ],
+)
+def test_filter_liquid(kwargs, expected):
+    assert _chain().filter_liquid(**kwargs).symbols.tolist() == expected
+
+
+def test_to_dataframe_columns():
+    chain = _chain()
+    df = chain.to_dataframe()
+
+    assert df.columns.tolist() == [
+        "symbol", "underlying", "expiry", "strike", "type", "bid", "ask", "mid", "last",
+        "volume", "open_interest", "iv", "vega", "moneyness", "maturity",
+    ]
+    assert len(df) == 3
+    assert df["type"].tolist() == ["C", "P", "C"]
+    assert (df["underlying"] == "X").all()
+    np.testing.assert_allclose(df["mid"], chain.mids)
+    assert df["bid"].isna().tolist() == [False, True, False]
+
+
+def test_pickle_round_trip():
+    chain = _chain()
+    chain.is_liquid = np.array([True, False, True])
+    chain.by_expiry()   # memo is populated before pickling
+
+    restored = pickle.loads(pickle.dumps(chain))
+
+    assert restored.contracts == chain.contracts
+    assert restored.expiries() == chain.expiries()
+    np.testing.assert_array_equal(restored.is_liquid, chain.is_liquid)
+    assert (restored.underlying, restored.as_of, restored.spot) == (chain.underlying, chain.as_of, chain.spot)
+
+
+def test_views_follow_reassigned_columns():
+    chain = _chain()
+    assert chain.expiries() == ["2025-03-21", "2025-06-20"]
+    before = chain.by_expiry()["2025-03-21"][0].mid
+
+    chain.mids = chain.mids * 2
+    assert chain.by_expiry()["2025-03-21"][0].mid == 2 * before
+
+    chain.expiry_dates = np.array(["2025-09-19"] * len(chain), dtype=object)
+    assert chain.expiries() == ["2025-09-19"]
+    assert list(chain.by_expiry()) == ["2025-09-19"]
+
+
+def test_views_are_memoized_until_invalidated():
+    chain = _chain()
+    assert chain.by_expiry() is chain.by_expiry()
+    assert chain.expiries() is chain.expiries()
+
+    # In-place element writes are not seen by __setattr__: invalidate_views resets the memo
+    chain.mids[0] = 42.0
+    chain.invalidate_views()
+    assert chain.by_expiry()["2025-03-21"][0].mid == 42.0
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from src.option_pricer.models.option import OptionChain, OptionContract
+from src.option_pricer.utils.data_processors import option_chain_processor as proc_mod
+from src.option_pricer.utils.data_processors.option_chain_processor import OptionChainProcessor
+from src.option_pricer.utils.pricers.black_scholes import black_scholes_price, bsm_all_greeks
+
+S, R, Q, SIGMA = 100.0, 0.04, 0.01, 0.3
+
+
+@pytest.fixture(params=["numba", "python"])
+def processor(request, monkeypatch):
+    """Runs a test on the fused numba kernel and again on the NumPy fallback."""
+    if request.param == "numba" and proc_mod.iv_greeks_kernel is None:
+        pytest.skip("numba not installed")
+    if request.param == "python":
+        monkeypatch.setattr(proc_mod, "iv_greeks_kernel", None)
+    return OptionChainProcessor(risk_free_rate=R, dividend_yield=Q)
+
+
+def _quoted(expiry, tau, strike, option_type, spread=0.02):
+    mid = black_scholes_price(S, strike, R, Q, SIGMA, tau, option_type)
+    return OptionContract(
+        symbol=f"X{expiry}{option_type}{strike:g}",
+        underlying="X",
+        expiry=expiry,
+        strike=strike,
+        option_type=option_type,
+        bid=mid - spread / 2,
+        ask=mid + spread / 2,
+        last=mid,
+        volume=10,
+        open_interest=100,
+    )
+
+
+def _chain():
+    contracts = [
+        _quoted("2025-07-02", 0.5, 90.0, "C"),
+        _quoted("2025-07-02", 0.5, 110.0, "P"),
+        _quoted("2026-01-02", 1.0, 100.0, "C"),
+        # No quote at all: bid/ask stay missing, no IV
+        OptionContract("XNQ", "X", "2026-01-02", 120.0, "C", None, None, 1.0, 0, 0),
+        # Expired: dropped from the points, NaN IV in the chain
+        _quoted("2025-01-02", 0.5, 100.0, "C"),
+    ]
+    chain = OptionChain.from_contracts("X", "2025-01-02", S, contracts)
+    chain.enrich()
+    return chain
+
+
+def test_process_option_chain_solves_iv_and_greeks(processor):
+    chain = _chain()
+    points = processor.process_option_chain(chain)
+
+    assert [p.symbol for p in points] == chain.symbols[:4].tolist()
+    solved = points[:3]
+    for p, tau in zip(solved, (181 / 365, 181 / 365, 365 / 365)):
+        assert p.implied_vol == pytest.approx(SIGMA, abs=5e-3)
+        greeks = bsm_all_greeks(S, p.strike, R, Q, p.implied_vol, tau, p.type == "C")
+        for name in ("delta", "gamma", "theta", "rho"):
+            assert getattr(p, name) == pytest.approx(float(greeks[name]), rel=1e-6, abs=1e-9)
+
+    # IVs are written back into the chain, NaN where unsolved or expired
+    np.testing.assert_allclose(chain.implied_vols[:3], [p.implied_vol for p in solved])
+    assert np.isnan(chain.implied_vols[3:]).all()
+
+
+def test_missing_quotes_are_none_not_zero(processor):
+    points = processor.process_option_chain(_chain())
+    unquoted = points[3]
+
+    assert unquoted.bid is None and unquoted.ask is None and unquoted.mid is None
+    assert unquoted.implied_vol is None and unquoted.delta is None
+    assert isinstance(points[0].bid, float) and isinstance(points[0].ask, float)
+
+
+def test_vectorized_rows_match_the_chain_path(processor):
+    chain = _chain()
+    from_chain = processor.process_option_chain(chain)
+    rows = [
+        {"symbol": p.symbol, "expiry": p.expiry, "strike": p.strike, "type": p.type,
+         "bid": p.bid, "ask": p.ask, "tau": tau}
+        for p, tau in zip(from_chain, chain.maturity_years[:4])
+    ]
+
+    from_rows = processor.process_chain_vectorized(rows, S)
+
+    for a, b in zip(from_chain, from_rows):
+        assert (a.bid, a.ask, a.mid) == (b.bid, b.ask, b.mid)
+        assert (a.implied_vol is None) == (b.implied_vol is None)
+        if a.implied_vol is not None:
+            assert a.implied_vol == pytest.approx(b.implied_vol, abs=1e-6)